@@ -2,108 +2,566 @@
 Database configuration and connection management for SQLite
 """
 
+import functools
+import mmap
 import os
 import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
 from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
-# Load environment variables from .env file
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Timestamp format for generated backup file names
+_BACKUP_FMT = "%Y%m%d_%H%M%S"
+
+# Databases created before tenants.currency existed get the column on first
+# open, filled from the default_currency setting
+_Q_TENANT_COLUMNS = "SELECT name FROM pragma_table_info('tenants')"
+_MIGRATE_TENANT_CURRENCY = (
+    "ALTER TABLE tenants ADD COLUMN currency TEXT NOT NULL DEFAULT 'USD' "
+    "CHECK (length(currency) = 3)",
+    """UPDATE tenants SET currency = (
+           SELECT setting_value FROM system_settings WHERE setting_key = 'default_currency')
+       WHERE EXISTS (SELECT 1 FROM system_settings
+                     WHERE setting_key = 'default_currency' AND length(setting_value) = 3)""",
+)
+
+@functools.cache
+def _load_env():
+    """Load environment variables from .env file (once per process)."""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        # python-dotenv not installed, environment variables should be set manually
+        pass
+
+# Optional: apsw runs a whole multi-statement schema in a single call
 try:
-    from dotenv import load_dotenv
-    load_dotenv()
+    import apsw
 except ImportError:
-    # python-dotenv not installed, environment variables should be set manually
-    pass
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+    apsw = None
 
 class DatabaseConfig:
-    """Database configuration management."""
+    """Database configuration management.
+    
+    Settings are read from the environment on access, so changes made after
+    the config is created (e.g. by a test harness) take effect.
+    """
     
     def __init__(self):
-        self.database_path = os.getenv('DB_PATH', 'water_bill.db')
-        self.backup_dir = os.getenv('BACKUP_DIR', 'backups')
-        
+        _load_env()
+    
+    @property
+    def database_path(self) -> str:
+        return os.getenv('DB_PATH', 'water_bill.db')
+    
+    @property
+    def backup_dir(self) -> str:
+        return os.getenv('BACKUP_DIR', 'backups')
+    
+    @property
+    def mmap_size(self) -> int:
+        return int(os.getenv('SQLITE_MMAP_SIZE', 268435456))
+    
+    @property
+    def cache_size(self) -> int:
+        return int(os.getenv('SQLITE_CACHE_SIZE', -65536))
+    
+    @property
+    def journal_mode(self) -> str:
+        return os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+    
+    @property
+    def synchronous(self) -> str:
+        return os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    
+    @property
+    def cached_statements(self) -> int:
+        return int(os.getenv('SQLITE_CACHED_STATEMENTS', 256))
+    
+    @property
+    def pool_size(self) -> int:
+        """Number of pooled reader connections (writes use one extra connection)."""
+        return int(os.getenv('SQLITE_POOL_SIZE', 4))
+    
+    @property
+    def busy_timeout(self) -> int:
+        return int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000))
+    
+    @property
+    def page_size(self) -> int:
+        return int(os.getenv('SQLITE_PAGE_SIZE', 8192))
+    
     def get_database_path(self) -> str:
         """Get the database file path."""
         return self.database_path
 
+def dict_row(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Row factory building a plain dict directly, without a sqlite3.Row in between."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that keeps one reusable cursor per SQL text.
+    
+    statements mirrors the connection's LRU prepared-statement cache; it is
+    only touched by the thread the connection is lent to.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cursors: Dict[str, sqlite3.Cursor] = {}
+        self.statements: 'OrderedDict[str, bool]' = OrderedDict()
+
+@dataclass
+class PoolStats:
+    """Connection pool counters, updated under DatabaseManager._pool_lock."""
+    opens: int = 0
+    reuses: int = 0
+    in_use: int = 0
+
 class DatabaseManager:
-    """Database connection and transaction management."""
+    """Database connection pooling and transaction management.
+    
+    Reads are served from a pool of reader connections; all writes go through
+    a single writer connection guarded by a mutex, matching SQLite's one
+    writer / many readers model under WAL.
+    """
     
     def __init__(self, config: DatabaseConfig = None):
         self.config = config or DatabaseConfig()
-        self._connection = None
+        self._idle = deque()
+        self._pool_lock = threading.Lock()
+        self._pool_slots = threading.Semaphore(self.config.pool_size)
+        self._writer = None
+        self._writer_lock = threading.RLock()
+        # Set once _migrate() has checked the file this manager points at
+        self._migrated = False
+        self._migrate_lock = threading.Lock()
+        # Connection pinned to the current thread by transaction()
+        self._local = threading.local()
+        self.stats = PoolStats()
+        # Prepared-statement cache hit counters, summed over all connections
+        self._statement_stats_lock = threading.Lock()
+        self.statement_cache_hits = 0
+        self.statement_cache_misses = 0
     
-    def connect(self) -> sqlite3.Connection:
-        """Establish database connection."""
+    def _open_connection(self, readonly: bool = False) -> sqlite3.Connection:
+        """Open a new connection and apply the PRAGMA bundle.
+        
+        readonly=True makes it a pool reader, which SQLite then refuses to write through.
+        """
         try:
-            if self._connection is None:
-                self._connection = sqlite3.connect(
-                    self.config.get_database_path(),
-                    check_same_thread=False
-                )
-                # Enable foreign key constraints
-                self._connection.execute("PRAGMA foreign_keys = ON")
-                # Set row factory for dict-like access
-                self._connection.row_factory = sqlite3.Row
-                logger.info("Database connection established")
-            return self._connection
+            conn = sqlite3.connect(
+                self.config.get_database_path(),
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=self.config.cached_statements,
+                factory=_PooledConnection
+            )
+            # Enable foreign key constraints
+            conn.execute("PRAGMA foreign_keys = ON")
+            # WAL lets readers proceed during writes; NORMAL sync skips
+            # the fsync on every commit
+            conn.execute(f"PRAGMA journal_mode = {self.config.journal_mode}")
+            conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+            conn.execute(f"PRAGMA busy_timeout = {self.config.busy_timeout}")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA wal_autocheckpoint = 1000")
+            # Map the database file into memory and grow the page cache
+            conn.execute(f"PRAGMA mmap_size = {self.config.mmap_size}")
+            conn.execute(f"PRAGMA cache_size = {self.config.cache_size}")
+            if not self._migrated:
+                self._migrate(conn)
+            if readonly:
+                conn.execute("PRAGMA query_only = 1")
+            logger.debug(
+                "PRAGMA mmap_size = %s",
+                conn.execute("PRAGMA mmap_size").fetchone()[0]
+            )
+            logger.info("Database connection established")
+            return conn
         except sqlite3.Error as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
-    def disconnect(self):
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
-            logger.info("Database connection closed")
+    def _migrate(self, conn: sqlite3.Connection):
+        """Bring an older database file up to the current schema (once per manager)."""
+        with self._migrate_lock:
+            if self._migrated:
+                return
+            columns = {row[0] for row in conn.execute(_Q_TENANT_COLUMNS)}
+            # No tenants table yet: the schema file will create it complete
+            if columns and 'currency' not in columns:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for statement in _MIGRATE_TENANT_CURRENCY:
+                        conn.execute(statement)
+                    conn.execute("COMMIT")
+                    logger.info("Added tenants.currency column")
+                except sqlite3.OperationalError as e:
+                    conn.execute("ROLLBACK")
+                    # Another process may have migrated the file first
+                    if 'duplicate column' not in str(e):
+                        raise
+            self._migrated = True
     
-    @contextmanager
-    def get_cursor(self, commit: bool = True):
-        """Context manager for database cursor with automatic transaction management."""
-        conn = self.connect()
-        cursor = conn.cursor()
+    def acquire(self) -> sqlite3.Connection:
+        """Take a reader connection from the pool, opening one if none are idle."""
+        self._pool_slots.acquire()
         try:
-            yield cursor
-            if commit:
-                conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"Database transaction rolled back: {e}")
+            with self._pool_lock:
+                if self._idle:
+                    self.stats.reuses += 1
+                    self.stats.in_use += 1
+                    return self._idle.pop()
+            conn = self._open_connection(readonly=True)
+        except Exception:
+            self._pool_slots.release()
             raise
+        # Only counted once the connection exists
+        with self._pool_lock:
+            self.stats.opens += 1
+            self.stats.in_use += 1
+        return conn
+    
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool."""
+        with self._pool_lock:
+            self._idle.append(conn)
+            self.stats.in_use -= 1
+        self._pool_slots.release()
+    
+    @contextmanager
+    def acquire_reader(self):
+        """Context manager lending a reader connection from the pool."""
+        conn = self.acquire()
+        try:
+            yield conn
         finally:
-            cursor.close()
+            self.release(conn)
     
-    def execute_query(self, query: str, params: tuple = None, fetch: bool = False):
-        """Execute a query and optionally fetch results."""
-        with self.get_cursor() as cursor:
+    @contextmanager
+    def acquire_writer(self):
+        """Context manager holding the single writer connection.
+        
+        Writers are serialized by a mutex; a thread may re-enter it.
+        """
+        with self._writer_lock:
+            opened = self._writer is None
+            if opened:
+                self._writer = self._open_connection()
+            # PoolStats is shared with the readers, which update it under _pool_lock
+            with self._pool_lock:
+                if opened:
+                    self.stats.opens += 1
+                else:
+                    self.stats.reuses += 1
+            yield self._writer
+    
+    @contextmanager
+    def _connection(self, readonly: bool):
+        """Connection pinned by transaction(), else a reader or the writer."""
+        pinned = getattr(self._local, 'conn', None)
+        if pinned is not None:
+            yield pinned
+        elif readonly:
+            with self.acquire_reader() as conn:
+                yield conn
+        else:
+            with self.acquire_writer() as conn:
+                yield conn
+    
+    def in_transaction(self) -> bool:
+        """Whether the calling thread is inside a transaction() block."""
+        return getattr(self._local, 'conn', None) is not None
+    
+    def read(self):
+        """Context manager yielding a connection for reads.
+        
+        Inside transaction() this is the pinned connection; otherwise a
+        query_only reader from the pool.
+        """
+        return self._connection(readonly=True)
+    
+    def write(self):
+        """Context manager yielding a connection for writes.
+        
+        Inside transaction() this is the pinned connection; otherwise the
+        single writer connection, held under the writer lock.
+        """
+        return self._connection(readonly=False)
+    
+    def disconnect(self):
+        """Close all idle pooled connections and the writer connection."""
+        with self._pool_lock:
+            closed = len(self._idle)
+            while self._idle:
+                self._idle.pop().close()
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                closed += 1
+        if closed:
+            logger.info("Database connection closed")
+    
+    @contextmanager
+    def get_cursor(self, commit: bool = True, row_factory=None, readonly: bool = False):
+        """Context manager for database cursor with explicit transaction management.
+        
+        Connections run in autocommit mode, so the cursor's statements are
+        wrapped in BEGIN/COMMIT here (or rolled back if commit is False).
+        readonly=True runs on a reader connection and skips the transaction,
+        relying on WAL snapshot reads; otherwise the writer connection is used.
+        Rows are plain tuples unless a row_factory (e.g. sqlite3.Row) is given.
+        Inside an explicit transaction() block the cursor joins the ambient
+        transaction and leaves commit/rollback to the outer block.
+        """
+        own_transaction = getattr(self._local, 'conn', None) is None and not readonly
+        with self._connection(readonly) as conn:
+            cursor = conn.cursor()
+            if row_factory is not None:
+                cursor.row_factory = row_factory
+            try:
+                if own_transaction:
+                    cursor.execute("BEGIN")
+                yield cursor
+                if own_transaction:
+                    cursor.execute("COMMIT" if commit else "ROLLBACK")
+            except Exception as e:
+                if own_transaction and conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                    logger.error(f"Database transaction rolled back: {e}")
+                raise
+            finally:
+                cursor.close()
+    
+    @contextmanager
+    def transaction(self, readonly: bool = False):
+        """Context manager grouping several statements into a single transaction.
+        
+        The connection stays pinned to the calling thread until the block exits.
+        Write transactions hold the writer connection for the whole block.
+        With readonly=True a reader connection and a deferred BEGIN are used,
+        giving a consistent read snapshot without taking the write lock.
+        """
+        pinned = getattr(self._local, 'conn', None)
+        if pinned is not None:
+            # Nested block: join the outer transaction
+            yield pinned
+            return
+        
+        with self._connection(readonly) as conn:
+            conn.execute("BEGIN" if readonly else "BEGIN IMMEDIATE")
+            self._local.conn = conn
+            self._local.after_commit = []
+            try:
+                yield conn
+                conn.execute("COMMIT")
+                callbacks = self._local.after_commit
+            except Exception as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                logger.error(f"Database transaction rolled back: {e}")
+                raise
+            finally:
+                self._local.conn = None
+                self._local.after_commit = None
+        for callback in callbacks:
+            callback()
+    
+    def after_commit(self, callback):
+        """Call callback once the calling thread's transaction() commits.
+        
+        Outside a transaction it is called right away; on rollback never.
+        """
+        pending = getattr(self._local, 'after_commit', None)
+        if pending is None:
+            callback()
+        else:
+            pending.append(callback)
+    
+    def _track_statement(self, conn: _PooledConnection, query: str):
+        """Record whether a query text is already in conn's prepared-statement cache."""
+        statements = conn.statements
+        hit = query in statements
+        if hit:
+            statements.move_to_end(query)
+        else:
+            statements[query] = True
+            if len(statements) > self.config.cached_statements:
+                statements.popitem(last=False)
+        with self._statement_stats_lock:
+            if hit:
+                self.statement_cache_hits += 1
+            else:
+                self.statement_cache_misses += 1
+    
+    def statement_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for the per-connection prepared-statement caches."""
+        with self._statement_stats_lock:
+            hits, misses = self.statement_cache_hits, self.statement_cache_misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+            'cached_statements': self.config.cached_statements
+        }
+    
+    def execute_query(self, query: str, params: tuple = None, fetch: bool = False,
+                      row_factory=sqlite3.Row, readonly: bool = False):
+        """Execute a query and optionally fetch results.
+        
+        Pass readonly=True for SELECTs so they run on a reader connection.
+        """
+        with self.get_cursor(row_factory=row_factory, readonly=readonly) as cursor:
+            self._track_statement(cursor.connection, query)
             cursor.execute(query, params or ())
             if fetch:
                 return cursor.fetchall()
             return cursor.rowcount
     
+    def execute_query_fast(self, query: str, params: tuple = None, fetch: bool = False,
+                           readonly: bool = False):
+        """Execute a query via Connection.execute, without the get_cursor() wrapper.
+        
+        Rows are plain tuples. Joins the ambient transaction like get_cursor().
+        """
+        with self._connection(readonly) as conn:
+            self._track_statement(conn, query)
+            # Autocommit: a single statement is its own transaction
+            cursor = conn.execute(query, params or ())
+            return cursor.fetchall() if fetch else cursor.rowcount
+    
+    def _cached_cursor(self, conn: _PooledConnection, query: str) -> sqlite3.Cursor:
+        """Get the connection's reusable cursor for a SQL text, creating it on first use."""
+        cursor = conn.cursors.get(query)
+        if cursor is None:
+            if len(conn.cursors) >= self.config.cached_statements:
+                conn.cursors.clear()
+            cursor = conn.cursors[query] = conn.cursor()
+        return cursor
+    
+    def execute_cached(self, query: str, params: tuple = None, fetch: bool = False,
+                       readonly: bool = False, row_factory=sqlite3.Row):
+        """Execute one fixed SQL statement through the connection's statement cache.
+        
+        sqlite3 keeps prepared statements per connection keyed by SQL text, so
+        passing the same constant string skips parsing and planning after the
+        first call. Each connection also keeps one cursor per SQL text, so no
+        cursor object is created per call. Rows are sqlite3.Row objects unless
+        row_factory=None asks for plain tuples. There is no BEGIN/COMMIT
+        wrapper: outside a transaction() block the statement autocommits.
+        """
+        with self._connection(readonly) as conn:
+            self._track_statement(conn, query)
+            cursor = self._cached_cursor(conn, query)
+            cursor.row_factory = row_factory
+            cursor.execute(query, params or ())
+            return cursor.fetchall() if fetch else cursor.rowcount
+    
+    def execute_scalar(self, query: str, params: tuple = None, readonly: bool = True):
+        """Return the first column of a single-row query, or None if it returns no row.
+        
+        Uses the same per-connection cursors as execute_cached, but builds no
+        row list; fetching the only row also finishes and resets the statement.
+        """
+        with self._connection(readonly) as conn:
+            self._track_statement(conn, query)
+            cursor = self._cached_cursor(conn, query)
+            cursor.row_factory = None
+            row = cursor.execute(query, params or ()).fetchone()
+            return row[0] if row is not None else None
+    
+    def iter_query(self, query: str, params: tuple = None, row_factory=None):
+        """Yield the rows of a SELECT one at a time instead of fetching them all.
+        
+        Rows are plain tuples unless a row_factory (e.g. dict_row) is given.
+        The reader connection is held until the generator is exhausted or closed.
+        """
+        with self._connection(readonly=True) as conn:
+            self._track_statement(conn, query)
+            cursor = conn.cursor()
+            cursor.row_factory = row_factory
+            try:
+                cursor.execute(query, params or ())
+                yield from cursor
+            finally:
+                cursor.close()
+    
     def execute_many(self, query: str, params_list: list):
         """Execute a query with multiple parameter sets."""
         with self.get_cursor() as cursor:
+            self._track_statement(cursor.connection, query)
             cursor.executemany(query, params_list)
             return cursor.rowcount
     
     def test_connection(self) -> bool:
         """Test database connection."""
         try:
-            with self.get_cursor() as cursor:
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                return result[0] == 1
+            with self.acquire_reader() as conn:
+                return conn.execute("SELECT 1").fetchone()[0] == 1
         except Exception as e:
             logger.error(f"Database connection test failed: {e}")
             return False
     
+    def _apply_schema(self, schema_file: str):
+        """Run a schema file through the stdlib sqlite3 writer connection."""
+        with self.acquire_writer() as conn:
+            # The schema can simply be re-run after a crash, so skip the
+            # rollback journal and fsync while it is applied
+            try:
+                conn.execute("PRAGMA journal_mode = MEMORY")
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Keeping journal mode during schema setup: {e}")
+            conn.execute("PRAGMA synchronous = OFF")
+            try:
+                # Map the schema file and feed it to SQLite one complete
+                # statement at a time, all inside a single transaction
+                with open(schema_file, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    conn.execute("BEGIN")
+                    try:
+                        statement = ''
+                        for line in iter(mm.readline, b''):
+                            statement += line.decode('utf-8')
+                            if sqlite3.complete_statement(statement):
+                                conn.execute(statement)
+                                statement = ''
+                        conn.execute("COMMIT")
+                    except Exception:
+                        if conn.in_transaction:
+                            conn.execute("ROLLBACK")
+                        raise
+            finally:
+                conn.execute(f"PRAGMA journal_mode = {self.config.journal_mode}")
+                conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+    
+    def _apply_schema_apsw(self, schema_file: str):
+        """Run a schema file through apsw, which executes all statements in one call."""
+        with open(schema_file, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            schema_sql = mm[:].decode('utf-8')
+        
+        conn = apsw.Connection(self.config.get_database_path())
+        try:
+            cursor = conn.cursor()
+            # The schema can simply be re-run after a crash, so skip fsync
+            cursor.execute("PRAGMA synchronous = OFF")
+            with conn:
+                cursor.execute(schema_sql)
+        finally:
+            conn.close()
+    
     def initialize_database(self, schema_file: str = 'database_schema_sqlite.sql'):
         """Initialize database with schema from SQL file."""
         try:
@@ -111,12 +569,26 @@ class DatabaseManager:
                 logger.error(f"Schema file not found: {schema_file}")
                 return False
             
-            with open(schema_file, 'r') as f:
-                schema_sql = f.read()
+            # Leaving WAL mode needs the only open connection to the file
+            self.disconnect()
+            self._migrated = False
             
-            # Split and execute statements (SQLite doesn't support executescript with parameters)
-            with self.get_cursor() as cursor:
-                cursor.executescript(schema_sql)
+            # page_size and auto_vacuum only take effect before the first write,
+            # so apply them on a plain connection when the file is new
+            db_path = self.config.get_database_path()
+            if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+                conn = sqlite3.connect(db_path)
+                try:
+                    conn.execute(f"PRAGMA page_size = {self.config.page_size}")
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    conn.execute("VACUUM")
+                finally:
+                    conn.close()
+            
+            if apsw is not None:
+                self._apply_schema_apsw(schema_file)
+            else:
+                self._apply_schema(schema_file)
             
             logger.info("Database schema initialized successfully")
             return True
@@ -126,34 +598,44 @@ class DatabaseManager:
             return False
     
     def backup_database(self, backup_file: str = None) -> bool:
-        """Create a backup of the database."""
-        import shutil
-        from datetime import datetime
-        
+        """Create a backup of the database using SQLite's Online Backup API."""
         try:
             if backup_file is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = time.strftime(_BACKUP_FMT)
                 backup_file = f"water_bill_backup_{timestamp}.db"
             
             # Ensure backup directory exists
             backup_dir = self.config.backup_dir
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
+            os.makedirs(backup_dir, exist_ok=True)
             
             backup_path = os.path.join(backup_dir, backup_file)
             source_path = self.config.get_database_path()
             
-            if os.path.exists(source_path):
-                shutil.copy2(source_path, backup_path)
-                logger.info(f"Database backup created: {backup_path}")
-                return True
-            else:
-                logger.error(f"Source database not found: {source_path}")
-                return False
+            def progress(status, remaining, total):
+                logger.debug(f"Backup progress: {total - remaining}/{total} pages")
+            
+            # Copy pages through SQLite so uncheckpointed WAL frames are
+            # included and writers are only locked per batch of pages.
+            # mode=ro fails on a missing source instead of creating it.
+            src = sqlite3.connect(f"{Path(source_path).absolute().as_uri()}?mode=ro", uri=True)
+            try:
+                dst = sqlite3.connect(backup_path)
+                try:
+                    src.backup(dst, pages=1024, progress=progress)
+                finally:
+                    dst.close()
+            finally:
+                src.close()
+            logger.info(f"Database backup created: {backup_path}")
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to create backup: {e}")
             return False
 
-# Create a global database manager instance
-db_manager = DatabaseManager()
\ No newline at end of file
+def __getattr__(name):
+    """Create the global database manager instance on first access."""
+    if name == 'db_manager':
+        globals()['db_manager'] = DatabaseManager()
+        return globals()['db_manager']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
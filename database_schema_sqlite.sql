@@ -14,7 +14,8 @@ CREATE TABLE IF NOT EXISTS tenants (
     email TEXT,
     created_date DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_date DATETIME DEFAULT CURRENT_TIMESTAMP,
-    is_active BOOLEAN DEFAULT 1
+    is_active BOOLEAN DEFAULT 1,
+    currency TEXT NOT NULL DEFAULT 'USD' CHECK (length(currency) = 3)
 );
 
 -- Create water_readings table
@@ -68,9 +69,17 @@ INSERT OR IGNORE INTO system_settings (setting_key, setting_value, description)
     ('grace_period_days', '10', 'Grace period before late fees apply');
 
 -- Create indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_water_readings_tenant_id ON water_readings(tenant_id);
+-- Per-tenant lookups are served by composite indexes that also cover the
+-- usual ordering/filter column; they replace the single-column tenant_id ones
+DROP INDEX IF EXISTS idx_water_readings_tenant_id;
+DROP INDEX IF EXISTS idx_bills_tenant_id;
+CREATE INDEX IF NOT EXISTS idx_readings_tenant_date ON water_readings(tenant_id, reading_date DESC);
 CREATE INDEX IF NOT EXISTS idx_water_readings_date ON water_readings(reading_date);
-CREATE INDEX IF NOT EXISTS idx_bills_tenant_id ON bills(tenant_id);
+CREATE INDEX IF NOT EXISTS idx_bills_tenant_status ON bills(tenant_id, bill_status);
+CREATE INDEX IF NOT EXISTS idx_bills_tenant_gendate ON bills(tenant_id, generated_date DESC);
+-- Partial index holding only unpaid bills, in the order outstanding lists use
+CREATE INDEX IF NOT EXISTS idx_bills_outstanding ON bills(tenant_id, generated_date DESC)
+    WHERE bill_status <> 'paid';
 CREATE INDEX IF NOT EXISTS idx_bills_period ON bills(bill_period_start, bill_period_end);
 CREATE INDEX IF NOT EXISTS idx_tenants_apartment ON tenants(apartment_number);
 
@@ -126,4 +135,7 @@ JOIN water_readings wr ON t.tenant_id = wr.tenant_id
 WHERE t.is_active = 1
 GROUP BY DATE(wr.reading_date, 'start of month'), t.tenant_id, t.name, t.apartment_number
 HAVING COUNT(wr.id) >= 2
-ORDER BY month DESC, t.apartment_number;
\ No newline at end of file
+ORDER BY month DESC, t.apartment_number;
+
+-- Refresh planner statistics so the composite indexes get used
+ANALYZE;
@@ -2,10 +2,9 @@
 Database utilities for SQLite Water Bill Tracking System
 """
 
+import json
 import os
 import sys
-import shutil
-from datetime import datetime
 import logging
 
 from database import db_manager
@@ -29,18 +28,18 @@ def check_database_status():
     
     # Check if tables exist
     try:
-        with db_manager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name NOT LIKE 'sqlite_%'
-                ORDER BY name
+        # Aggregate the table names in SQLite and fetch them as one JSON value
+        with db_manager.get_cursor(readonly=True) as cursor:
+            cursor.execute(r"""
+                SELECT json_group_array(name) FROM sqlite_master 
+                WHERE type='table' AND name NOT LIKE 'sqlite\_%' ESCAPE '\'
             """)
-            tables = cursor.fetchall()
+            tables = json.loads(cursor.fetchone()[0])
             
             if tables:
                 print("✅ Database tables found:")
-                for table in tables:
-                    print(f"   - {table[0]}")
+                for table in sorted(tables):
+                    print(f"   - {table}")
             else:
                 print("⚠️  No tables found. Run setup to initialize schema.")
             
@@ -73,10 +72,7 @@ def initialize_schema():
 def backup_database(backup_file: str = None):
     """Create a backup of the database."""
     try:
-        if backup_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = f"water_bill_backup_{timestamp}.db"
-        
+        # db_manager picks a timestamped file name when none is given
         success = db_manager.backup_database(backup_file)
         if success:
             print(f"✅ Backup created successfully!")
@@ -92,6 +88,8 @@ def backup_database(backup_file: str = None):
 
 def restore_database(backup_file: str):
     """Restore database from backup."""
+    import shutil
+    
     if not os.path.exists(backup_file):
         print(f"❌ Backup file not found: {backup_file}")
         return False
@@ -144,6 +142,8 @@ def setup_database():
 
 def main():
     """Main utility function."""
+    logging.basicConfig(level=logging.INFO)
+    
     if len(sys.argv) < 2:
         print("Database Utilities for SQLite Water Bill Tracking System")
         print("="*60)
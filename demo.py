@@ -3,6 +3,7 @@
 Demo script for SQLite-based Water Bill Tracking System
 """
 
+import logging
 import os
 from datetime import datetime, timedelta
 
@@ -34,11 +35,10 @@ def demo_sqlite():
             ("T003", "Bob Johnson", "C303", "555-9012", "bob.johnson@email.com"),
         ]
         
-        for tenant_id, name, apt, phone, email in tenants_data:
-            if service.add_tenant(tenant_id, name, apt, phone, email):
-                print(f"  ✅ Added: {name} ({tenant_id})")
-            else:
-                print(f"  ⚠️  Tenant {tenant_id} already exists or failed to add")
+        added = service.add_tenants_bulk(tenants_data)
+        print(f"  ✅ Added {added} tenants")
+        if added < len(tenants_data):
+            print(f"  ⚠️  {len(tenants_data) - added} tenants already existed")
         
         # Demo 2: Add water readings
         print("\n2️⃣ Adding water readings...")
@@ -52,10 +52,6 @@ def demo_sqlite():
             ("T003", 1500.0, previous_month),
         ]
         
-        for tenant_id, reading, date in readings_data:
-            if service.add_water_reading(tenant_id, reading, date, "Initial reading"):
-                print(f"  ✅ Added initial reading for {tenant_id}: {reading}")
-        
         # Current readings
         current_readings = [
             ("T001", 1150.0),
@@ -63,9 +59,18 @@ def demo_sqlite():
             ("T003", 1650.0),
         ]
         
-        for tenant_id, reading in current_readings:
-            if service.add_water_reading(tenant_id, reading, current_date, "Monthly reading"):
-                print(f"  ✅ Added current reading for {tenant_id}: {reading}")
+        with db_manager.transaction():
+            added = service.add_water_readings_bulk(
+                [(tenant_id, reading, date, "Initial reading")
+                 for tenant_id, reading, date in readings_data]
+            )
+            print(f"  ✅ Added {added} initial readings")
+            
+            added = service.add_water_readings_bulk(
+                [(tenant_id, reading, current_date, "Monthly reading")
+                 for tenant_id, reading in current_readings]
+            )
+            print(f"  ✅ Added {added} current readings")
         
         # Demo 3: Calculate and display bills
         print("\n3️⃣ Calculating bills...")
@@ -79,10 +84,9 @@ def demo_sqlite():
         
         # Demo 4: Generate actual bills
         print("\n4️⃣ Generating bills...")
-        for tenant_id, name, _, _, _ in tenants_data:
-            bill = service.generate_bill(tenant_id)
-            if bill:
-                print(f"  ✅ Bill #{bill.id} generated for {name}")
+        names = {tenant_id: name for tenant_id, name, _, _, _ in tenants_data}
+        for bill in service.generate_bills(list(names)):
+            print(f"  ✅ Bill #{bill.id} generated for {names[bill.tenant_id]}")
         
         print("\n🎉 Demo completed successfully!")
         print(f"\nDatabase location: {os.path.abspath(db_manager.config.get_database_path())}")
@@ -97,4 +101,5 @@ def demo_sqlite():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     demo_sqlite()
\ No newline at end of file
@@ -5,15 +5,62 @@ A simple GUI for the Water Bill Tracking System
 import tkinter as tk
 from tkinter import ttk, messagebox
 from services import WaterBillService
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import logging
+import queue
 import re
 
+_EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 class WaterBillGUI:
+    # Rows fetched per page for the readings and bills trees
+    PAGE_SIZE = 200
+    
+    # Refresh clicks within this many milliseconds are coalesced into one refresh
+    REFRESH_DEBOUNCE_MS = 150
+    
+    # How often the UI thread collects finished background work
+    RESULT_POLL_MS = 50
+    
+    # (column, width) pairs of each Treeview
+    _COLS = {
+        'tenant_tree': (('ID', 100), ('Name', 100), ('Apartment', 100), ('Phone', 100), ('Email', 100)),
+        'readings_tree': (('Date', 100), ('Tenant', 100), ('Apartment', 100), ('Reading', 100), ('Notes', 100)),
+        'bills_tree': (('Bill ID', 100), ('Tenant', 100), ('Period', 100), ('Units', 100),
+                       ('Amount', 100), ('Status', 100)),
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Water Bill Management System")
         self.service = WaterBillService()
         
+        # Database work runs on one worker thread so the UI thread stays responsive.
+        # The worker never touches Tk: finished futures are queued and picked
+        # up by _poll_results() on the UI thread
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._results = queue.Queue()
+        self._poll_id = self.root.after(self.RESULT_POLL_MS, self._poll_results)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Paging state of the readings and bills trees
+        self._page_offsets = {}
+        self._page_more = {}
+        
+        # Rows shown in each Treeview: {tree: {key: (iid, values)}}
+        self._tree_rows = {}
+        
+        # Tenants backing the combobox entries, in display order
+        self._combo_tenants = []
+        self._last_combo_hash = None
+        # Service tenants_version the comboboxes were last filled from
+        self._combo_version = None
+        
+        # Pending debounced refreshes: {refresh method: after() id}
+        self._pending_refresh = {}
+        
         # Set window size and make it non-resizable
         self.root.geometry("800x600")
         self.root.resizable(False, False)
@@ -31,10 +78,10 @@ class WaterBillGUI:
         self.notebook.add(self.readings_tab, text='Water Readings')
         self.notebook.add(self.bills_tab, text='View Bills')
         
-        # Initialize tabs
+        # Only the first tab is built up front; the others are built on first display
         self.setup_tenant_tab()
-        self.setup_readings_tab()
-        self.setup_bills_tab()
+        self._built = {0: True}
+        self.notebook.bind('<<NotebookTabChanged>>', self._ensure_tab_built)
         
         # Refresh data
         self.refresh_all_data()
@@ -63,13 +110,8 @@ class WaterBillGUI:
         right_frame.grid(row=0, column=1, padx=10, pady=5, sticky="nsew")
         
         # Tenant Treeview
-        self.tenant_tree = ttk.Treeview(right_frame, columns=('ID', 'Name', 'Apartment', 'Phone', 'Email'), 
-                                      show='headings', height=15)
-        
-        # Set column headings
-        for col in self.tenant_tree['columns']:
-            self.tenant_tree.heading(col, text=col)
-            self.tenant_tree.column(col, width=100)
+        self.tenant_tree = ttk.Treeview(right_frame, height=15)
+        self._init_tree(self.tenant_tree, self._COLS['tenant_tree'])
         
         self.tenant_tree.pack(padx=5, pady=5)
         
@@ -77,7 +119,7 @@ class WaterBillGUI:
         button_frame = ttk.Frame(right_frame)
         button_frame.pack(pady=5)
         
-        ttk.Button(button_frame, text="Refresh", command=self.refresh_tenants).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Refresh", command=lambda: self._debounce(self.refresh_tenants)).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Delete Selected", command=self.delete_tenant, style='Danger.TButton').pack(side='left', padx=5)
     
     def setup_readings_tab(self):
@@ -113,20 +155,17 @@ class WaterBillGUI:
         right_frame.grid(row=0, column=1, padx=10, pady=5, sticky="nsew")
         
         # Readings Treeview
-        self.readings_tree = ttk.Treeview(right_frame, 
-            columns=('Date', 'Tenant', 'Apartment', 'Reading', 'Notes'),
-            show='headings', height=15
-        )
-        
-        # Set column headings
-        for col in self.readings_tree['columns']:
-            self.readings_tree.heading(col, text=col)
-            self.readings_tree.column(col, width=100)
+        self.readings_tree = ttk.Treeview(right_frame, height=15)
+        self._init_tree(self.readings_tree, self._COLS['readings_tree'])
         
         self.readings_tree.pack(padx=5, pady=5)
+        for event in ('<MouseWheel>', '<Button-5>'):
+            self.readings_tree.bind(
+                event, lambda e: self._maybe_load_more(self.readings_tree, self._fetch_readings), add='+'
+            )
         
         # Refresh button
-        ttk.Button(right_frame, text="Refresh", command=self.refresh_readings).pack(pady=5)
+        ttk.Button(right_frame, text="Refresh", command=lambda: self._debounce(self.refresh_readings)).pack(pady=5)
     
     def setup_bills_tab(self):
         # Top Frame - Generate Bill
@@ -147,25 +186,94 @@ class WaterBillGUI:
         bottom_frame.pack(fill='both', expand=True, padx=10, pady=5)
         
         # Bills Treeview
-        self.bills_tree = ttk.Treeview(bottom_frame, 
-            columns=('Bill ID', 'Tenant', 'Period', 'Units', 'Amount', 'Status'),
-            show='headings', height=15
-        )
-        
-        # Set column headings
-        for col in self.bills_tree['columns']:
-            self.bills_tree.heading(col, text=col)
-            self.bills_tree.column(col, width=100)
+        self.bills_tree = ttk.Treeview(bottom_frame, height=15)
+        self._init_tree(self.bills_tree, self._COLS['bills_tree'])
         
         self.bills_tree.pack(padx=5, pady=5)
+        for event in ('<MouseWheel>', '<Button-5>'):
+            self.bills_tree.bind(
+                event, lambda e: self._maybe_load_more(self.bills_tree, self._fetch_bills), add='+'
+            )
         
         # Buttons Frame
         button_frame = ttk.Frame(bottom_frame)
         button_frame.pack(pady=5)
         
-        ttk.Button(button_frame, text="Refresh", command=self.refresh_bills).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Refresh", command=lambda: self._debounce(self.refresh_bills)).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Mark as Paid", command=self.mark_bill_paid).pack(side='left', padx=5)
     
+    @staticmethod
+    def _init_tree(tree, cols):
+        """Configure a Treeview's columns, then set each heading and width once."""
+        tree.configure(columns=tuple(col for col, _ in cols), show='headings')
+        for col, width in cols:
+            tree.heading(col, text=col)
+            tree.column(col, width=width)
+    
+    def _ensure_tab_built(self, event=None):
+        """Build the selected tab on first display and load its data."""
+        index = self.notebook.index('current')
+        if self._built.get(index):
+            return
+        self._built[index] = True
+        
+        if index == 1:
+            self.setup_readings_tab()
+            self._fill_tenant_combo(self.tenant_combo, self._tenant_labels())
+            self.refresh_readings()
+        elif index == 2:
+            self.setup_bills_tab()
+            self._fill_tenant_combo(self.bill_tenant_combo, self._tenant_labels())
+            self.refresh_bills()
+    
+    def _tenant_combos(self):
+        """Tenant comboboxes of the tabs built so far."""
+        combos = []
+        if self._built.get(1):
+            combos.append(self.tenant_combo)
+        if self._built.get(2):
+            combos.append(self.bill_tenant_combo)
+        return combos
+    
+    def _debounce(self, refresh):
+        """Schedule refresh() shortly, replacing any call of it still pending."""
+        pending = self._pending_refresh.get(refresh)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_refresh[refresh] = self.root.after(
+            self.REFRESH_DEBOUNCE_MS, self._run_debounced, refresh
+        )
+    
+    def _run_debounced(self, refresh):
+        del self._pending_refresh[refresh]
+        refresh()
+    
+    def _run_in_background(self, func, on_done, error_prefix=''):
+        """Run func on the worker thread, then call on_done(result) on the UI thread.
+        
+        Exceptions from either step are reported in an error dialog.
+        """
+        future = self._pool.submit(func)
+        future.add_done_callback(
+            lambda f: self._results.put((f, on_done, error_prefix))
+        )
+    
+    def _poll_results(self):
+        """Hand finished background work to its on_done callback, then poll again."""
+        while True:
+            try:
+                item = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(*item)
+        self._poll_id = self.root.after(self.RESULT_POLL_MS, self._poll_results)
+    
+    def _deliver(self, future, on_done, error_prefix):
+        try:
+            on_done(future.result())
+        except Exception as e:
+            messagebox.showerror("Error", f"{error_prefix}{str(e)}")
+    
     def add_tenant(self):
         try:
             # Get values from entries
@@ -182,26 +290,41 @@ class WaterBillGUI:
                 raise ValueError("Tenant ID, Name, and Apartment are required!")
             
             # Validate email format if provided
-            if tenant_data['email'] and not re.match(r"[^@]+@[^@]+\.[^@]+", tenant_data['email']):
+            if tenant_data['email'] and not _EMAIL_RE.match(tenant_data['email']):
                 raise ValueError("Invalid email format!")
             
-            # Add tenant using service
-            tenant = self.service.add_tenant(**tenant_data)
-            
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        def done(tenant):
             # Clear form
             for entry in self.tenant_entries.values():
                 entry.delete(0, tk.END)
             
             messagebox.showinfo("Success", f"Tenant {tenant.name} added successfully!")
-            self.refresh_all_data()
             
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            # Show just the new tenant, at its apartment-number position, instead
+            # of reloading every tab
+            index = self._row_position(
+                self.tenant_tree, lambda values: values[2] > tenant.apartment_number
+            )
+            self._insert_row(self.tenant_tree, tenant.tenant_id, self._tenant_values(tenant), index)
+            self._combo_tenants = self._combo_tenants + [tenant]
+            for combo in self._tenant_combos():
+                combo['values'] = tuple(combo['values']) + (self._tenant_label(tenant),)
+                if combo.current() < 0:
+                    combo.current(0)
+            self._last_combo_hash = hash(tuple(self._tenant_labels()))
+            self._combo_version = self.service.tenants_version
+        
+        # Add tenant using service
+        self._run_in_background(lambda: self.service.add_tenant(**tenant_data), done)
     
     def add_reading(self):
         try:
             # Get selected tenant
-            tenant_id = self.tenant_combo.get().split(' - ')[0]
+            tenant = self._selected_tenant(self.tenant_combo)
             
             # Validate reading
             try:
@@ -214,45 +337,64 @@ class WaterBillGUI:
             # Validate date
             date_str = self.date_entry.get()
             try:
+                # Cheap shape check first; strptime still rejects dates like 2024-02-30
+                if not _DATE_RE.match(date_str):
+                    raise ValueError
                 datetime.strptime(date_str, '%Y-%m-%d')
             except ValueError:
                 raise ValueError("Invalid date format! Use YYYY-MM-DD")
             
-            # Add reading
-            reading = self.service.add_water_reading(
-                tenant_id=tenant_id,
-                reading_units=reading_units,
-                reading_date=date_str,
-                notes=self.notes_entry.get()
-            )
+            notes = self.notes_entry.get()
+            
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        def done(reading):
+            if reading is None:
+                raise ValueError("Failed to add reading!")
             
             # Clear form
             self.reading_entry.delete(0, tk.END)
             self.notes_entry.delete(0, tk.END)
             
             messagebox.showinfo("Success", f"Reading added successfully!")
-            self.refresh_readings()
             
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            # Show just the new reading at its place in the newest-first list; it
+            # has the highest id, so it goes before readings of the same date
+            tree = self.readings_tree
+            index = self._row_position(tree, lambda values: values[0] <= reading.reading_date)
+            if index == len(tree.get_children()) and self._page_more.get(tree):
+                return  # Sorts after the loaded pages; the next page fetches it
+            self._insert_row(tree, reading.id,
+                             (reading.reading_date, tenant.name, tenant.apartment_number,
+                              f"{reading.reading_units:.1f}", reading.notes or ''), index)
+            self._page_offsets[tree] = self._page_offsets.get(tree, 0) + 1
+        
+        # Add reading
+        self._run_in_background(
+            lambda: self.service.add_water_reading(
+                tenant_id=tenant.tenant_id,
+                reading_units=reading_units,
+                reading_date=date_str,
+                notes=notes
+            ),
+            done
+        )
     
     def generate_bill(self):
+        # Get selected tenant
         try:
-            # Get selected tenant
-            tenant_id = self.bill_tenant_combo.get().split(' - ')[0]
-            
-            # Get last two readings
-            readings = self.service.get_tenant_readings(tenant_id)
-            if len(readings) < 2:
-                raise ValueError("Need at least two readings to generate a bill!")
-            
-            # Generate bill from last two readings
-            bill = self.service.generate_bill(
-                tenant_id=tenant_id,
-                start_reading_id=readings[-2].id,
-                end_reading_id=readings[-1].id
-            )
-            
+            tenant_id = self._selected_tenant_id(self.bill_tenant_combo)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        
+        def work():
+            # Generate bill from the tenant's last two readings
+            return self.service.generate_bill(tenant_id=tenant_id)
+        
+        def done(bill):
             messagebox.showinfo("Success", 
                 f"Bill generated successfully!\n"
                 f"Amount: ${bill.total_amount:.2f}\n"
@@ -260,94 +402,192 @@ class WaterBillGUI:
             )
             
             self.refresh_bills()
-            
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        
+        self._run_in_background(work, done)
     
     def mark_bill_paid(self):
         try:
             selected_item = self.bills_tree.selection()[0]
-            bill_id = int(self.bills_tree.item(selected_item)['values'][0])
-            
-            self.service.mark_bill_paid(bill_id)
-            messagebox.showinfo("Success", "Bill marked as paid!")
-            self.refresh_bills()
-            
+            bill_id = int(self.bills_tree.set(selected_item, 'Bill ID'))
         except IndexError:
             messagebox.showerror("Error", "Please select a bill first!")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            return
+        
+        def done(_):
+            messagebox.showinfo("Success", "Bill marked as paid!")
+            
+            # Update only the status cell of the paid bill
+            self.bills_tree.set(selected_item, 'Status', 'PAID')
+            rows = self._tree_rows.setdefault(self.bills_tree, {})
+            if bill_id in rows:
+                rows[bill_id] = (selected_item, rows[bill_id][1][:-1] + ('PAID',))
+        
+        self._run_in_background(lambda: self.service.mark_bill_paid(bill_id), done)
+    
+    def _sync_rows(self, tree, keyed_rows):
+        """Bring a Treeview in line with (key, values) pairs, touching only rows that differ.
+        
+        New keys are inserted at their position, vanished keys are deleted,
+        rows whose values changed are updated in place and rows out of order
+        (e.g. added by _insert_row) are moved to their position.
+        """
+        rows = self._tree_rows.setdefault(tree, {})
+        wanted = {key for key, _ in keyed_rows}
+        stale = [key for key in rows if key not in wanted]
+        if stale:
+            tree.delete(*[rows.pop(key)[0] for key in stale])
+        for index, (key, values) in enumerate(keyed_rows):
+            current = rows.get(key)
+            if current is None:
+                rows[key] = (tree.insert('', index, values=values), values)
+            elif current[1] != values:
+                tree.item(current[0], values=values)
+                rows[key] = (current[0], values)
+        
+        wanted_order = [rows[key][0] for key, _ in keyed_rows]
+        shown = list(tree.get_children())
+        if shown != wanted_order:
+            for index, iid in enumerate(wanted_order):
+                if shown[index] != iid:
+                    tree.move(iid, '', index)
+                    shown.remove(iid)
+                    shown.insert(index, iid)
+    
+    def _append_rows(self, tree, keyed_rows):
+        """Append (key, values) pairs that are not yet shown to the end of a Treeview."""
+        rows = self._tree_rows.setdefault(tree, {})
+        for key, values in keyed_rows:
+            if key not in rows:
+                rows[key] = (tree.insert('', 'end', values=values), values)
+    
+    def _row_position(self, tree, goes_before):
+        """Index of the first shown row for whose values goes_before() is true, else the row count."""
+        values_by_iid = dict(self._tree_rows.get(tree, {}).values())
+        children = tree.get_children()
+        for index, iid in enumerate(children):
+            if goes_before(values_by_iid[iid]):
+                return index
+        return len(children)
+    
+    def _insert_row(self, tree, key, values, index='end'):
+        """Insert a single (key, values) row into a Treeview, or update it if already shown."""
+        rows = self._tree_rows.setdefault(tree, {})
+        if key in rows:
+            tree.item(rows[key][0], values=values)
+            rows[key] = (rows[key][0], values)
+        else:
+            rows[key] = (tree.insert('', index, values=values), values)
+    
+    def refresh_tenants(self, tenants=None):
+        # Display tenants, fetching them on the worker thread unless the caller already has them
+        if tenants is None:
+            self._run_in_background(
+                lambda: self.service.get_all_tenants(refresh=True), self._populate_tenants
+            )
+        else:
+            self._populate_tenants(tenants)
+    
+    def _populate_tenants(self, tenants):
+        rows = [(tenant.tenant_id, self._tenant_values(tenant)) for tenant in tenants]
+        self._sync_rows(self.tenant_tree, rows)
     
-    def refresh_tenants(self):
-        # Clear existing items
-        for item in self.tenant_tree.get_children():
-            self.tenant_tree.delete(item)
-        
-        # Fetch and display tenants
-        tenants = self.service.get_all_tenants()
-        for tenant in tenants:
-            self.tenant_tree.insert('', 'end', values=(
-                tenant.tenant_id,
-                tenant.name,
-                tenant.apartment_number,
-                tenant.phone or '',
-                tenant.email or ''
-            ))
+    @staticmethod
+    def _tenant_values(tenant):
+        return (tenant.tenant_id, tenant.name, tenant.apartment_number,
+                tenant.phone or '', tenant.email or '')
+    
+    @staticmethod
+    def _tenant_label(tenant):
+        return f"{tenant.tenant_id} - {tenant.name} ({tenant.apartment_number})"
+    
+    def _load_page(self, tree, fetch, replace=False):
+        """Fetch the next page of a paged Treeview on the worker thread and append it.
+        
+        With replace=True the tree is reloaded from the first page.
+        """
+        offset = 0 if replace else self._page_offsets.get(tree, 0)
+        # Block scroll-triggered loads until this page has arrived
+        self._page_more[tree] = False
+        
+        def done(rows):
+            if replace:
+                self._sync_rows(tree, rows)
+            else:
+                self._append_rows(tree, rows)
+            self._page_offsets[tree] = offset + len(rows)
+            self._page_more[tree] = len(rows) == self.PAGE_SIZE
+        
+        self._run_in_background(lambda: fetch(offset), done)
+    
+    def _maybe_load_more(self, tree, fetch):
+        """Load the next page once the user scrolls near the bottom of the tree."""
+        if self._page_more.get(tree) and tree.yview()[1] > 0.9:
+            self._load_page(tree, fetch)
     
     def refresh_readings(self):
-        # Clear existing items
-        for item in self.readings_tree.get_children():
-            self.readings_tree.delete(item)
-        
-        # Fetch and display readings
-        for tenant in self.service.get_all_tenants():
-            readings = self.service.get_tenant_readings(tenant.tenant_id)
-            for reading in readings:
-                self.readings_tree.insert('', 'end', values=(
-                    reading.reading_date,
-                    tenant.name,
-                    tenant.apartment_number,
-                    f"{reading.reading_units:.1f}",
-                    reading.notes or ''
-                ))
+        # Reload the newest page of readings (one joined query for all tenants)
+        if not self._built.get(1):
+            return  # Loaded when the tab is first shown
+        self._load_page(self.readings_tree, self._fetch_readings, replace=True)
+    
+    def _fetch_readings(self, offset):
+        # Rows come back display-ready: (id, date, tenant, apartment, units, notes)
+        return [(row[0], row[1:]) for row in self.service.get_recent_readings(self.PAGE_SIZE, offset)]
     
     def refresh_bills(self):
-        # Clear existing items
-        for item in self.bills_tree.get_children():
-            self.bills_tree.delete(item)
-        
-        # Fetch and display bills
-        for tenant in self.service.get_all_tenants():
-            bills = self.service.get_tenant_bills(tenant.tenant_id)
-            for bill in bills:
-                self.bills_tree.insert('', 'end', values=(
-                    bill.id,
-                    tenant.name,
-                    f"{bill.bill_period_start} to {bill.bill_period_end}",
-                    f"{bill.units_consumed:.1f}",
-                    f"${bill.total_amount:.2f}",
-                    bill.bill_status.upper()
-                ))
-    
-    def refresh_tenant_combos(self):
+        # Reload the newest page of bills (one joined query for all tenants)
+        if not self._built.get(2):
+            return  # Loaded when the tab is first shown
+        self._load_page(self.bills_tree, self._fetch_bills, replace=True)
+    
+    def _fetch_bills(self, offset):
+        # Rows come back display-ready: (id, tenant, period, units, amount, status)
+        return [(row[0], row) for row in self.service.get_recent_bills(self.PAGE_SIZE, offset)]
+    
+    def refresh_tenant_combos(self, tenants=None):
         # Get all tenants for comboboxes
-        tenants = self.service.get_all_tenants()
-        tenant_list = [f"{t.tenant_id} - {t.name} ({t.apartment_number})" for t in tenants]
-        
-        # Update comboboxes
-        self.tenant_combo['values'] = tenant_list
-        self.bill_tenant_combo['values'] = tenant_list
-        
+        if tenants is None:
+            self._run_in_background(self.service.get_all_tenants, self._populate_tenant_combos)
+        else:
+            self._populate_tenant_combos(tenants)
+    
+    def _selected_tenant(self, combo):
+        """Get the tenant for the combobox selection, by index into the cached tenant list."""
+        index = combo.current()
+        if index < 0:
+            raise ValueError("Please select a tenant!")
+        return self._combo_tenants[index]
+    
+    def _selected_tenant_id(self, combo):
+        return self._selected_tenant(combo).tenant_id
+    
+    def _populate_tenant_combos(self, tenants):
+        self._combo_tenants = tenants
+        tenant_list = self._tenant_labels()
+        
+        # Update comboboxes only when the tenant list changed (or nothing is selected)
+        list_hash = hash(tuple(tenant_list))
+        changed = list_hash != self._last_combo_hash
+        self._last_combo_hash = list_hash
+        for combo in self._tenant_combos():
+            if changed or not combo.get():
+                self._fill_tenant_combo(combo, tenant_list)
+    
+    def _tenant_labels(self):
+        return [self._tenant_label(t) for t in self._combo_tenants]
+    
+    @staticmethod
+    def _fill_tenant_combo(combo, tenant_list):
+        combo['values'] = tenant_list
         if tenant_list:
-            self.tenant_combo.set(tenant_list[0])
-            self.bill_tenant_combo.set(tenant_list[0])
+            combo.set(tenant_list[0])
     
     def delete_tenant(self):
         try:
             # Get selected tenant
             selected_item = self.tenant_tree.selection()[0]
-            tenant_id = self.tenant_tree.item(selected_item)['values'][0]
-            tenant_name = self.tenant_tree.item(selected_item)['values'][1]
+            tenant_id = self.tenant_tree.set(selected_item, 'ID')
+            tenant_name = self.tenant_tree.set(selected_item, 'Name')
             
             # Confirm deletion
             if not messagebox.askyesno("Confirm Delete", 
@@ -356,39 +596,66 @@ class WaterBillGUI:
                 "This action cannot be undone."):
                 return
             
-            # Check for existing bills and readings
-            readings = self.service.get_tenant_readings(tenant_id)
-            bills = self.service.get_tenant_bills(tenant_id)
+        except IndexError:
+            messagebox.showerror("Error", "Please select a tenant to delete!")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to delete tenant: {str(e)}")
+            return
+        
+        def done(_):
+            messagebox.showinfo("Success", f"Tenant {tenant_name} and all related data deleted successfully!")
             
-            if readings or bills:
+            # Refresh all data
+            self.refresh_all_data()
+        
+        def confirm(counts):
+            # Warn about existing bills and readings before deleting them
+            n_readings, n_bills = counts
+            if n_readings or n_bills:
                 if not messagebox.askyesno("Warning", 
                     f"This tenant has:\n"
-                    f"- {len(readings)} water readings\n"
-                    f"- {len(bills)} bills\n\n"
+                    f"- {n_readings} water readings\n"
+                    f"- {n_bills} bills\n\n"
                     "All related data will be permanently deleted.\n"
                     "Do you want to continue?"):
                     return
             
             # Delete tenant using service layer
-            self.service.delete_tenant(tenant_id)
-            
-            messagebox.showinfo("Success", f"Tenant {tenant_name} and all related data deleted successfully!")
-            
-            # Refresh all data
-            self.refresh_all_data()
-            
-        except IndexError:
-            messagebox.showerror("Error", "Please select a tenant to delete!")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete tenant: {str(e)}")
+            self._run_in_background(
+                lambda: self.service.delete_tenant(tenant_id), done,
+                error_prefix="Failed to delete tenant: "
+            )
+        
+        self._run_in_background(
+            lambda: self.service.get_tenant_counts(tenant_id), confirm,
+            error_prefix="Failed to delete tenant: "
+        )
     
     def refresh_all_data(self):
-        self.refresh_tenants()
+        def populate(result):
+            tenants, version = result
+            self._populate_tenants(tenants)
+            # Comboboxes only change when tenants were added or deleted
+            if version != self._combo_version:
+                self._combo_version = version
+                self._populate_tenant_combos(tenants)
+        
+        # The single worker runs these fetches in order
+        self._run_in_background(
+            lambda: (self.service.get_all_tenants(), self.service.tenants_version), populate
+        )
         self.refresh_readings()
         self.refresh_bills()
-        self.refresh_tenant_combos()
+    
+    def close(self):
+        """Stop the worker thread and close the window."""
+        self.root.after_cancel(self._poll_id)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 def main():
+    logging.basicConfig(level=logging.INFO)
     root = tk.Tk()
     
     # Configure style for danger button
@@ -4,32 +4,41 @@
 Final Verification Test for Water Bill Tracking System
 """
 
+import logging
+import sys
+
 from services import WaterBillService
 
-def main():
+def main(quiet: bool = False):
+    logging.basicConfig(level=logging.WARNING if quiet else logging.INFO)
+    
+    # All checks read from one snapshot taken over a single connection
+    snapshot = WaterBillService().verification_snapshot()
+    
+    if not snapshot.tenants:
+        print('⚠️  No tenants found. Run demo.py to add sample data.')
+        return
+    
+    if quiet:
+        print(f'✅ {len(snapshot.tenants)} tenants, {len(snapshot.outstanding)} unpaid bills')
+        return
+    
     print('\n' + '='*60)
     print('🌊 Water Bill System - Final Verification Test')
     print('='*60)
 
-    service = WaterBillService()
-
     # Test 1: List all tenants
-    tenants = service.get_all_tenants()
+    tenants = snapshot.tenants
     print(f'\n✅ Test 1: Tenant Management')
     print(f'   Found {len(tenants)} tenants')
 
-    if not tenants:
-        print('\n⚠️  No tenants found. Run demo.py to add sample data.')
-        return
-
     # Test 2: Get readings
     tenant = tenants[0]
-    readings = service.get_tenant_readings(tenant.tenant_id)
     print(f'\n✅ Test 2: Water Readings')
-    print(f'   Tenant {tenant.name} has {len(readings)} readings')
+    print(f'   Tenant {tenant.name} has {len(snapshot.first_tenant_readings)} readings')
 
     # Test 3: Calculate bill
-    bill_data = service.calculate_bill(tenant.tenant_id)
+    bill_data = snapshot.bill_data
     if bill_data:
         print(f'\n✅ Test 3: Bill Calculation')
         print(f'   Calculated bill: ${bill_data["total_amount"]:.2f}')
@@ -38,22 +47,19 @@ def main():
         print(f'\n⚠️  Test 3: Could not calculate bill (needs 2+ readings)')
 
     # Test 4: Get bills
-    bills = service.get_tenant_bills(tenant.tenant_id)
     print(f'\n✅ Test 4: Bill Management')
-    print(f'   Found {len(bills)} bills for {tenant.name}')
+    print(f'   Found {len(snapshot.bills)} bills for {tenant.name}')
 
     # Test 5: Get summaries
-    summaries = service.get_tenant_summary()
     print(f'\n✅ Test 5: Reporting')
-    print(f'   Generated {len(summaries)} tenant summaries')
+    print(f'   Generated {len(snapshot.summaries)} tenant summaries')
 
     # Test 6: Outstanding bills
-    outstanding = service.get_outstanding_bills()
     print(f'\n✅ Test 6: Outstanding Bills')
-    print(f'   Found {len(outstanding)} unpaid bills')
+    print(f'   Found {len(snapshot.outstanding)} unpaid bills')
 
     # Test 7: Settings
-    settings = service.get_all_settings()
+    settings = snapshot.settings
     print(f'\n✅ Test 7: System Settings')
     print(f'   Rate per unit: ${settings.get("default_rate_per_unit", "N/A")}')
     print(f'   Currency: {settings.get("default_currency", "N/A")}')
@@ -66,4 +72,4 @@ def main():
     print('='*60 + '\n')
 
 if __name__ == "__main__":
-    main()
+    main(quiet='--quiet' in sys.argv[1:])
@@ -3,20 +3,188 @@ Data models for the Water Bill Tracking System using SQLite
 """
 
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from dataclasses import dataclass
+from itertools import starmap
+import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 
-from database import DatabaseManager, db_manager
+import database
+from database import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# SQL is kept in constants so every call passes sqlite3 the identical text
+# and reuses the connection's prepared statement
+
+# Selected columns, in the field order of the matching dataclass (see from_row)
+_TENANT_COLS = ("tenant_id, name, apartment_number, phone, email, "
+                "created_date, updated_date, is_active, currency, id")
+_READING_COLS = "tenant_id, reading_units, reading_date, recorded_date, notes, created_by, id"
+_BILL_COLS = ("tenant_id, bill_period_start, bill_period_end, units_consumed, rate_per_unit, "
+              "total_amount, start_reading_id, end_reading_id, currency, bill_status, "
+              "generated_date, due_date, paid_date, id")
+_BILL_COLS_B = ", ".join(f"b.{col}" for col in _BILL_COLS.split(", "))
+
+# Bulk loads at least this large refresh the table's planner statistics
+_ANALYZE_MIN_ROWS = 500
+
+_Q_INSERT_TENANT = """
+    INSERT INTO tenants (tenant_id, name, apartment_number, phone, email, is_active, currency)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_Q_CREATE_TENANT = _Q_INSERT_TENANT + " RETURNING id, created_date, updated_date"
+_Q_GET_TENANT = f"SELECT {_TENANT_COLS} FROM tenants WHERE tenant_id = ? AND is_active = 1"
+_Q_ALL_TENANTS = f"SELECT {_TENANT_COLS} FROM tenants ORDER BY apartment_number"
+_Q_ACTIVE_TENANTS = f"SELECT {_TENANT_COLS} FROM tenants WHERE is_active = 1 ORDER BY apartment_number"
+_Q_UPDATE_TENANT = """
+    UPDATE tenants 
+    SET name = ?, apartment_number = ?, phone = ?, email = ?, is_active = ?, currency = ?
+    WHERE tenant_id = ?
+"""
+_Q_DEACTIVATE_TENANT = "UPDATE tenants SET is_active = 0 WHERE tenant_id = ?"
+_Q_DELETE_TENANT = "DELETE FROM tenants WHERE tenant_id = ?"
+_Q_TENANT_EXISTS = "SELECT EXISTS (SELECT 1 FROM tenants WHERE tenant_id = ?)"
+
+_Q_INSERT_READING = """
+    INSERT INTO water_readings (tenant_id, reading_units, reading_date, notes, created_by)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_Q_CREATE_READING = _Q_INSERT_READING + " RETURNING id, recorded_date"
+_Q_TENANT_READINGS = f"""
+    SELECT {_READING_COLS} FROM water_readings 
+    WHERE tenant_id = ? 
+    ORDER BY reading_date DESC
+"""
+_Q_TENANT_READINGS_LIMIT = _Q_TENANT_READINGS + " LIMIT ?"
+_Q_TENANT_READINGS_ASC = f"""
+    SELECT {_READING_COLS} FROM water_readings 
+    WHERE tenant_id = ? 
+    ORDER BY reading_date
+"""
+# The latest N readings, re-sorted oldest first
+_Q_TENANT_READINGS_ASC_LIMIT = f"""
+    SELECT * FROM ({_Q_TENANT_READINGS_LIMIT})
+    ORDER BY reading_date
+"""
+# A literal LIMIT lets the planner stop at the first entry of idx_readings_tenant_date
+_Q_LATEST_READING = _Q_TENANT_READINGS + " LIMIT 1"
+_Q_READING_RANGE = f"""
+    SELECT {_READING_COLS} FROM water_readings 
+    WHERE tenant_id = ? AND reading_date BETWEEN ? AND ?
+    ORDER BY reading_date ASC
+"""
+
+_Q_INSERT_BILL = """
+    INSERT INTO bills (tenant_id, bill_period_start, bill_period_end, 
+                     start_reading_id, end_reading_id, units_consumed, 
+                     rate_per_unit, total_amount, currency, bill_status, due_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_Q_CREATE_BILL = _Q_INSERT_BILL + " RETURNING id, generated_date"
+_Q_TENANT_BILLS = f"""
+    SELECT {_BILL_COLS} FROM bills 
+    WHERE tenant_id = ? 
+    ORDER BY generated_date DESC
+"""
+_Q_OUTSTANDING_BILLS = f"""
+    SELECT {_BILL_COLS} FROM bills 
+    WHERE tenant_id = ? AND bill_status <> 'paid' 
+    ORDER BY generated_date DESC
+"""
+# Unpaid bills for a JSON array of tenant IDs, grouped in array order
+_Q_OUTSTANDING_FOR_TENANTS = f"""
+    SELECT {_BILL_COLS_B} FROM json_each(?) AS j
+    JOIN bills b ON b.tenant_id = j.value AND b.bill_status <> 'paid'
+    ORDER BY j.key, b.generated_date DESC
+"""
+_Q_MARK_BILL_PAID = """
+    UPDATE bills 
+    SET bill_status = 'paid', paid_date = ? 
+    WHERE id = ?
+"""
+
+_Q_GET_SETTING = "SELECT setting_value FROM system_settings WHERE setting_key = ?"
+_Q_SET_SETTING = """
+    INSERT INTO system_settings (setting_key, setting_value, description)
+    VALUES (?, ?, ?)
+    ON CONFLICT (setting_key) 
+    DO UPDATE SET setting_value = ?, description = COALESCE(?, system_settings.description)
+"""
+_Q_ALL_SETTINGS = "SELECT setting_key, setting_value FROM system_settings"
+
+def _sql_date(value):
+    """Date/datetime as the ISO text SQLite stores and reads return; other values as-is."""
+    if isinstance(value, datetime):
+        return value.isoformat(' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
 class BaseRepository:
     """Base repository with database access."""
-    def __init__(self, db_manager_instance=None):
-        self.db_manager = db_manager_instance or db_manager
+    def __init__(self, db_manager_instance: Optional[DatabaseManager] = None):
+        self._db_manager = db_manager_instance
+    
+    @property
+    def db_manager(self) -> DatabaseManager:
+        """The injected manager, else the shared database.db_manager.
+        
+        Resolved on every access, so importing models does not create the
+        shared manager.
+        """
+        return self._db_manager or database.db_manager
+    
+    @property
+    def _shared_manager(self) -> bool:
+        """Whether this repository uses the shared manager the process-wide caches belong to."""
+        return self._db_manager is None or self._db_manager is database.db_manager
+    
+    def _insert_one(self, query: str, params: tuple) -> tuple:
+        """Run a single INSERT ... RETURNING and return its row."""
+        return self.db_manager.execute_cached(query, params, fetch=1, row_factory=None)[0]
+    
+    def _bulk_insert(self, table: str, query: str, params_list: List[tuple],
+                     returning: str) -> List[tuple]:
+        """Insert many rows with executemany, all or none.
+        
+        Returns the `returning` columns of the new rows in insert order; they are
+        found by id, which AUTOINCREMENT hands out in insert order. Large loads
+        re-ANALYZE the table so the planner keeps using its indexes. Inside an
+        outer transaction() the rows go in under a savepoint, so a failed batch
+        leaves nothing behind for the outer block to commit.
+        """
+        nested = self.db_manager.in_transaction()
+        # BEGIN IMMEDIATE takes the write lock before MAX(id) is read; under a
+        # deferred BEGIN a commit from another connection in between would
+        # make the insert fail with SQLITE_BUSY_SNAPSHOT
+        with self.db_manager.transaction() as conn:
+            cursor = conn.cursor()
+            try:
+                if nested:
+                    cursor.execute("SAVEPOINT bulk_insert")
+                cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+                last_id = cursor.fetchone()[0]
+                cursor.executemany(query, params_list)
+                if len(params_list) >= _ANALYZE_MIN_ROWS:
+                    cursor.execute(f"ANALYZE {table}")
+                cursor.execute(f"SELECT {returning} FROM {table} WHERE id > ? ORDER BY id", (last_id,))
+                rows = cursor.fetchall()
+                if nested:
+                    cursor.execute("RELEASE bulk_insert")
+                return rows
+            except Exception:
+                if nested and conn.in_transaction:
+                    cursor.execute("ROLLBACK TO bulk_insert")
+                    cursor.execute("RELEASE bulk_insert")
+                raise
+            finally:
+                cursor.close()
 
-@dataclass
+@dataclass(slots=True)
 class Tenant:
     """Tenant data model."""
     tenant_id: str
@@ -27,9 +195,20 @@ class Tenant:
     created_date: Optional[datetime] = None
     updated_date: Optional[datetime] = None
     is_active: bool = 1
+    currency: str = 'USD'
     id: Optional[int] = None
+    
+    @classmethod
+    def from_rows(cls, rows) -> List['Tenant']:
+        """Build tenants from rows selected as _TENANT_COLS, without a Python call per row."""
+        return list(starmap(cls, rows))
+    
+    @classmethod
+    def from_row(cls, row) -> 'Tenant':
+        """Build a tenant from a row selected as _TENANT_COLS."""
+        return cls(*row)
 
-@dataclass
+@dataclass(slots=True)
 class WaterReading:
     """Water reading data model."""
     tenant_id: str
@@ -39,8 +218,18 @@ class WaterReading:
     notes: Optional[str] = None
     created_by: Optional[str] = None
     id: Optional[int] = None
+    
+    @classmethod
+    def from_rows(cls, rows) -> List['WaterReading']:
+        """Build readings from rows selected as _READING_COLS, without a Python call per row."""
+        return list(starmap(cls, rows))
+    
+    @classmethod
+    def from_row(cls, row) -> 'WaterReading':
+        """Build a reading from a row selected as _READING_COLS."""
+        return cls(*row)
 
-@dataclass
+@dataclass(slots=True)
 class Bill:
     """Bill data model."""
     tenant_id: str
@@ -57,8 +246,18 @@ class Bill:
     due_date: Optional[date] = None
     paid_date: Optional[datetime] = None
     id: Optional[int] = None
+    
+    @classmethod
+    def from_rows(cls, rows) -> List['Bill']:
+        """Build bills from rows selected as _BILL_COLS, without a Python call per row."""
+        return list(starmap(cls, rows))
+    
+    @classmethod
+    def from_row(cls, row) -> 'Bill':
+        """Build a bill from a row selected as _BILL_COLS."""
+        return cls(*row)
 
-@dataclass
+@dataclass(slots=True)
 class SystemSetting:
     """System setting data model."""
     setting_key: str
@@ -70,73 +269,133 @@ class SystemSetting:
 class TenantRepository(BaseRepository):
     """Repository for tenant data operations."""
     
+    # Process-wide LRU of active tenant rows for get_by_id(), keyed by tenant_id
+    # and holding (row, loaded_at). Misses are not cached, so inserts never
+    # leave it stale; the TTL bounds how long writes from other processes go
+    # unseen. invalidate() bumps the generation so a read that raced with it
+    # is not cached.
+    _by_id: 'OrderedDict[str, tuple]' = OrderedDict()
+    _by_id_lock = threading.Lock()
+    _by_id_maxsize = 1024
+    _by_id_ttl = 60.0
+    _by_id_generation = 0
+    
+    def invalidate(self, tenant_id: str = None):
+        """Drop one tenant (or, with no ID, every tenant) from the get_by_id cache.
+        
+        Inside a transaction the entry is dropped again once it commits, in
+        case another thread cached the old row in between.
+        """
+        self._drop_cached(tenant_id)
+        if self.db_manager.in_transaction():
+            self.db_manager.after_commit(lambda: self._drop_cached(tenant_id))
+    
+    @classmethod
+    def _drop_cached(cls, tenant_id: Optional[str]):
+        with cls._by_id_lock:
+            cls._by_id_generation += 1
+            if tenant_id is None:
+                cls._by_id.clear()
+            else:
+                cls._by_id.pop(tenant_id, None)
+    
+    @classmethod
+    def _cached_row(cls, tenant_id: str) -> Optional[tuple]:
+        """The cached row for a tenant, or None if absent or expired."""
+        with cls._by_id_lock:
+            entry = cls._by_id.get(tenant_id)
+            if entry is None:
+                return None
+            row, loaded_at = entry
+            if time.monotonic() - loaded_at >= cls._by_id_ttl:
+                del cls._by_id[tenant_id]
+                return None
+            cls._by_id.move_to_end(tenant_id)
+            return row
+    
+    @classmethod
+    def _store_row(cls, tenant_id: str, row: tuple, generation: int):
+        """Cache a row read while the cache was at generation, unless invalidated since."""
+        with cls._by_id_lock:
+            if cls._by_id_generation == generation:
+                cls._by_id[tenant_id] = (row, time.monotonic())
+                if len(cls._by_id) > cls._by_id_maxsize:
+                    cls._by_id.popitem(last=False)
+    
+    @staticmethod
+    def _params(t: Tenant) -> tuple:
+        return (t.tenant_id, t.name, t.apartment_number, t.phone, t.email,
+                t.is_active, t.currency)
+    
     def create(self, tenant: Tenant) -> Optional[Tenant]:
         """Create a new tenant."""
-        query = """
-            INSERT INTO tenants (tenant_id, name, apartment_number, phone, email, is_active)
-            VALUES (?, ?, ?, ?, ?, ?)
-            RETURNING id, created_date, updated_date
-        """
         try:
-            result = self.db_manager.execute_query(
-                query,
-                (tenant.tenant_id, tenant.name, tenant.apartment_number,
-                 tenant.phone, tenant.email, tenant.is_active),
-                fetch=True
-            )
-            if result:
-                row = result[0]
-                tenant.id = row['id']
-                tenant.created_date = row['created_date']
-                tenant.updated_date = row['updated_date']
-                logger.info(f"Created tenant: {tenant.tenant_id}")
-                return tenant
+            row = self._insert_one(_Q_CREATE_TENANT, self._params(tenant))
         except Exception as e:
             logger.error(f"Failed to create tenant: {e}")
-        return None
+            return None
+        tenant.id, tenant.created_date, tenant.updated_date = row
+        logger.info(f"Created tenant: {tenant.tenant_id}")
+        return tenant
     
-    @staticmethod
-    def get_by_id(tenant_id: str) -> Optional[Tenant]:
-        """Get tenant by ID."""
-        query = "SELECT * FROM tenants WHERE tenant_id = ? AND is_active = 1"
+    def bulk_create(self, tenants: List[Tenant]) -> List[Tenant]:
+        """Create several tenants in one transaction (all or none)."""
+        try:
+            rows = self._bulk_insert(
+                'tenants', _Q_INSERT_TENANT, list(map(self._params, tenants)),
+                'id, created_date, updated_date'
+            )
+        except Exception as e:
+            logger.error(f"Failed to create tenants: {e}")
+            return []
+        
+        for tenant, row in zip(tenants, rows):
+            tenant.id, tenant.created_date, tenant.updated_date = row
+        logger.info(f"Created tenants: {', '.join(t.tenant_id for t in tenants)}")
+        return tenants
+    
+    def get_by_id(self, tenant_id: str) -> Optional[Tenant]:
+        """Get an active tenant by ID, from the LRU cache when possible.
+        
+        A fresh Tenant is built on every call, so callers may modify it.
+        """
+        cached = self._shared_manager
+        if cached:
+            row = self._cached_row(tenant_id)
+            if row is not None:
+                return Tenant.from_row(row)
+        generation = self._by_id_generation
         try:
-            result = db_manager.execute_query(query, (tenant_id,), fetch=1)
+            result = self.db_manager.execute_cached(_Q_GET_TENANT, (tenant_id,), fetch=1, readonly=True, row_factory=None)
             if result:
                 row = result[0]
-                return Tenant(**dict(row))
+                # Rows read inside a transaction may still be rolled back
+                if cached and not self.db_manager.in_transaction():
+                    self._store_row(tenant_id, row, generation)
+                return Tenant.from_row(row)
         except Exception as e:
             logger.error(f"Failed to get tenant {tenant_id}: {e}")
         return None
     
-    @staticmethod
-    def get_all(active_only: bool = 1) -> List[Tenant]:
+    def get_all(self, active_only: bool = 1) -> List[Tenant]:
         """Get all tenants."""
-        query = "SELECT * FROM tenants"
-        if active_only:
-            query += " WHERE is_active = 1"
-        query += " ORDER BY apartment_number"
-        
+        query = _Q_ACTIVE_TENANTS if active_only else _Q_ALL_TENANTS
         try:
-            result = db_manager.execute_query(query, fetch=1)
-            return [Tenant(**dict(row)) for row in result]
+            result = self.db_manager.execute_cached(query, fetch=1, readonly=True, row_factory=None)
+            return Tenant.from_rows(result)
         except Exception as e:
             logger.error(f"Failed to get tenants: {e}")
             return []
     
-    @staticmethod
-    def update(tenant: Tenant) -> bool:
+    def update(self, tenant: Tenant) -> bool:
         """Update tenant information."""
-        query = """
-            UPDATE tenants 
-            SET name = ?, apartment_number = ?, phone = ?, email = ?, is_active = ?
-            WHERE tenant_id = ?
-        """
         try:
-            rows_affected = db_manager.execute_query(
-                query,
+            rows_affected = self.db_manager.execute_cached(
+                _Q_UPDATE_TENANT,
                 (tenant.name, tenant.apartment_number, tenant.phone, 
-                 tenant.email, tenant.is_active, tenant.tenant_id)
+                 tenant.email, tenant.is_active, tenant.currency, tenant.tenant_id)
             )
+            self.invalidate(tenant.tenant_id)
             if rows_affected > 0:
                 logger.info(f"Updated tenant: {tenant.tenant_id}")
                 return 1
@@ -144,16 +403,12 @@ class TenantRepository(BaseRepository):
             logger.error(f"Failed to update tenant {tenant.tenant_id}: {e}")
         return 0
     
-    @staticmethod
-    def delete(tenant_id: str, soft_delete: bool = 1) -> bool:
+    def delete(self, tenant_id: str, soft_delete: bool = 1) -> bool:
         """Delete or deactivate tenant."""
-        if soft_delete:
-            query = "UPDATE tenants SET is_active = 0 WHERE tenant_id = ?"
-        else:
-            query = "DELETE FROM tenants WHERE tenant_id = ?"
-        
+        query = _Q_DEACTIVATE_TENANT if soft_delete else _Q_DELETE_TENANT
         try:
-            rows_affected = db_manager.execute_query(query, (tenant_id,))
+            rows_affected = self.db_manager.execute_cached(query, (tenant_id,))
+            self.invalidate(tenant_id)
             if rows_affected > 0:
                 action = "deactivated" if soft_delete else "deleted"
                 logger.info(f"Tenant {tenant_id} {action}")
@@ -162,13 +417,14 @@ class TenantRepository(BaseRepository):
             logger.error(f"Failed to delete tenant {tenant_id}: {e}")
         return 0
     
-    @staticmethod
-    def exists(tenant_id: str) -> bool:
+    def exists(self, tenant_id: str) -> bool:
         """Check if tenant exists."""
-        query = "SELECT 1 FROM tenants WHERE tenant_id = ?"
+        # Cached rows are active tenants, so an unexpired hit answers without
+        # a query (the same staleness bound get_by_id() accepts)
+        if self._shared_manager and self._cached_row(tenant_id) is not None:
+            return True
         try:
-            result = db_manager.execute_query(query, (tenant_id,), fetch=1)
-            return len(result) > 0
+            return bool(self.db_manager.execute_scalar(_Q_TENANT_EXISTS, (tenant_id,)))
         except Exception as e:
             logger.error(f"Failed to check tenant existence {tenant_id}: {e}")
             return 0
@@ -176,68 +432,87 @@ class TenantRepository(BaseRepository):
 class WaterReadingRepository(BaseRepository):
     """Repository for water reading data operations."""
     
+    @staticmethod
+    def _params(r: WaterReading) -> tuple:
+        # Store and hand back dates as text, the type every read returns
+        r.reading_date = _sql_date(r.reading_date)
+        return (r.tenant_id, r.reading_units, r.reading_date, r.notes, r.created_by)
+    
     def create(self, reading: WaterReading) -> Optional[WaterReading]:
         """Create a new water reading."""
-        query = """
-            INSERT INTO water_readings (tenant_id, reading_units, reading_date, notes, created_by)
-            VALUES (?, ?, ?, ?, ?)
-            RETURNING id, recorded_date
-        """
         try:
-            result = db_manager.execute_query(
-                query,
-                (reading.tenant_id, reading.reading_units, reading.reading_date,
-                 reading.notes, reading.created_by),
-                fetch=1
-            )
-            if result:
-                row = result[0]
-                reading.id = row['id']
-                reading.recorded_date = row['recorded_date']
-                logger.info(f"Created water reading for tenant: {reading.tenant_id}")
-                return reading
+            row = self._insert_one(_Q_CREATE_READING, self._params(reading))
         except Exception as e:
             logger.error(f"Failed to create water reading: {e}")
-        return None
+            return None
+        reading.id, reading.recorded_date = row
+        logger.info(f"Created water reading for tenant: {reading.tenant_id}")
+        return reading
     
-    @staticmethod
-    def get_by_tenant(tenant_id: str, limit: Optional[int] = None) -> List[WaterReading]:
-        """Get water readings for a tenant."""
-        query = """
-            SELECT * FROM water_readings 
-            WHERE tenant_id = ? 
-            ORDER BY reading_date DESC
-        """
-        params = [tenant_id]
+    def bulk_create(self, readings: List[WaterReading]) -> List[WaterReading]:
+        """Create several water readings in one transaction (all or none)."""
+        try:
+            rows = self._bulk_insert(
+                'water_readings', _Q_INSERT_READING, list(map(self._params, readings)),
+                'id, recorded_date'
+            )
+        except Exception as e:
+            logger.error(f"Failed to create water readings: {e}")
+            return []
+        
+        for reading, row in zip(readings, rows):
+            reading.id, reading.recorded_date = row
+        logger.info(f"Created {len(readings)} water reading(s)")
+        return readings
+    
+    def get_by_tenant(self, tenant_id: str, limit: Optional[int] = None,
+                      order: str = 'desc') -> List[WaterReading]:
+        """Get water readings for a tenant.
         
+        With ``order='asc'`` the rows come back oldest first; a limit still
+        picks the latest readings.
+        """
+        if order not in ('asc', 'desc'):
+            raise ValueError(f"order must be 'asc' or 'desc', not {order!r}")
+        asc = order == 'asc'
         if limit:
-            query += " LIMIT ?"
-            params.append(limit)
+            query = _Q_TENANT_READINGS_ASC_LIMIT if asc else _Q_TENANT_READINGS_LIMIT
+            params = (tenant_id, limit)
+        else:
+            query = _Q_TENANT_READINGS_ASC if asc else _Q_TENANT_READINGS
+            params = (tenant_id,)
         
         try:
-            result = db_manager.execute_query(query, tuple(params), fetch=1)
-            return [WaterReading(**dict(row)) for row in result]
+            result = self.db_manager.execute_cached(query, params, fetch=1, readonly=True, row_factory=None)
+            return WaterReading.from_rows(result)
         except Exception as e:
             logger.error(f"Failed to get readings for tenant {tenant_id}: {e}")
             return []
     
-    @staticmethod
-    def get_latest_reading(tenant_id: str) -> Optional[WaterReading]:
+    def iter_by_tenant(self, tenant_id: str) -> Iterator[WaterReading]:
+        """Yield water readings for a tenant, newest first, without building a list."""
+        for row in self.db_manager.iter_query(_Q_TENANT_READINGS, (tenant_id,)):
+            yield WaterReading.from_row(row)
+    
+    def get_latest_reading(self, tenant_id: str) -> Optional[WaterReading]:
         """Get the latest water reading for a tenant."""
-        readings = WaterReadingRepository.get_by_tenant(tenant_id, limit=1)
-        return readings[0] if readings else None
+        try:
+            result = self.db_manager.execute_cached(
+                _Q_LATEST_READING, (tenant_id,), fetch=1, readonly=True, row_factory=None
+            )
+            return WaterReading.from_row(result[0]) if result else None
+        except Exception as e:
+            logger.error(f"Failed to get latest reading for tenant {tenant_id}: {e}")
+            return None
     
-    @staticmethod
-    def get_reading_range(tenant_id: str, start_date: datetime, end_date: datetime) -> List[WaterReading]:
+    def get_reading_range(self, tenant_id: str, start_date: datetime, end_date: datetime) -> List[WaterReading]:
         """Get water readings within a date range."""
-        query = """
-            SELECT * FROM water_readings 
-            WHERE tenant_id = ? AND reading_date BETWEEN ? AND ?
-            ORDER BY reading_date ASC
-        """
         try:
-            result = db_manager.execute_query(query, (tenant_id, start_date, end_date), fetch=1)
-            return [WaterReading(**dict(row)) for row in result]
+            result = self.db_manager.execute_cached(
+                _Q_READING_RANGE, (tenant_id, start_date, end_date),
+                fetch=1, readonly=True, row_factory=None
+            )
+            return WaterReading.from_rows(result)
         except Exception as e:
             logger.error(f"Failed to get readings for range: {e}")
             return []
@@ -245,62 +520,86 @@ class WaterReadingRepository(BaseRepository):
 class BillRepository(BaseRepository):
     """Repository for bill data operations."""
     
+    @staticmethod
+    def _params(b: Bill) -> tuple:
+        # Store and hand back dates as text, the type every read returns
+        b.bill_period_start = _sql_date(b.bill_period_start)
+        b.bill_period_end = _sql_date(b.bill_period_end)
+        b.due_date = _sql_date(b.due_date)
+        return (b.tenant_id, b.bill_period_start, b.bill_period_end,
+                b.start_reading_id, b.end_reading_id, b.units_consumed,
+                b.rate_per_unit, b.total_amount, b.currency,
+                b.bill_status, b.due_date)
+    
     def create(self, bill: Bill) -> Optional[Bill]:
         """Create a new bill."""
-        query = """
-            INSERT INTO bills (tenant_id, bill_period_start, bill_period_end, 
-                             start_reading_id, end_reading_id, units_consumed, 
-                             rate_per_unit, total_amount, currency, bill_status, due_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            RETURNING id, generated_date
-        """
         try:
-            result = db_manager.execute_query(
-                query,
-                (bill.tenant_id, bill.bill_period_start, bill.bill_period_end,
-                 bill.start_reading_id, bill.end_reading_id, bill.units_consumed,
-                 bill.rate_per_unit, bill.total_amount, bill.currency,
-                 bill.bill_status, bill.due_date),
-                fetch=1
-            )
-            if result:
-                row = result[0]
-                bill.id = row['id']
-                bill.generated_date = row['generated_date']
-                logger.info(f"Created bill for tenant: {bill.tenant_id}")
-                return bill
+            row = self._insert_one(_Q_CREATE_BILL, self._params(bill))
         except Exception as e:
             logger.error(f"Failed to create bill: {e}")
-        return None
+            return None
+        bill.id, bill.generated_date = row
+        logger.info(f"Created bill for tenant: {bill.tenant_id}")
+        return bill
     
-    @staticmethod
-    def get_by_tenant(tenant_id: str) -> List[Bill]:
+    def bulk_create(self, bills: List[Bill]) -> List[Bill]:
+        """Create several bills in one transaction (all or none)."""
+        try:
+            rows = self._bulk_insert(
+                'bills', _Q_INSERT_BILL, list(map(self._params, bills)),
+                'id, generated_date'
+            )
+        except Exception as e:
+            logger.error(f"Failed to create bills: {e}")
+            return []
+        
+        for bill, row in zip(bills, rows):
+            bill.id, bill.generated_date = row
+        logger.info(f"Created {len(bills)} bill(s)")
+        return bills
+    
+    def get_by_tenant(self, tenant_id: str) -> List[Bill]:
         """Get all bills for a tenant."""
-        query = """
-            SELECT * FROM bills 
-            WHERE tenant_id = ? 
-            ORDER BY generated_date DESC
-        """
         try:
-            result = db_manager.execute_query(query, (tenant_id,), fetch=1)
-            return [Bill(**dict(row)) for row in result]
+            result = self.db_manager.execute_cached(_Q_TENANT_BILLS, (tenant_id,), fetch=1, readonly=True, row_factory=None)
+            return Bill.from_rows(result)
         except Exception as e:
             logger.error(f"Failed to get bills for tenant {tenant_id}: {e}")
             return []
     
-    @staticmethod
-    def mark_as_paid(bill_id: int, payment_date: datetime = None) -> bool:
+    def get_outstanding(self, tenant_id: str) -> List[Bill]:
+        """Get a tenant's unpaid bills, newest first."""
+        try:
+            result = self.db_manager.execute_cached(_Q_OUTSTANDING_BILLS, (tenant_id,), fetch=1, readonly=True, row_factory=None)
+            return Bill.from_rows(result)
+        except Exception as e:
+            logger.error(f"Failed to get outstanding bills for tenant {tenant_id}: {e}")
+            return []
+    
+    def get_outstanding_for(self, tenant_ids: List[str]) -> List[Bill]:
+        """Get unpaid bills for several tenants in one query, in tenant_ids order."""
+        try:
+            result = self.db_manager.execute_cached(
+                _Q_OUTSTANDING_FOR_TENANTS, (json.dumps(list(tenant_ids)),),
+                fetch=1, readonly=True, row_factory=None
+            )
+            return Bill.from_rows(result)
+        except Exception as e:
+            logger.error(f"Failed to get outstanding bills: {e}")
+            return []
+    
+    def iter_by_tenant(self, tenant_id: str) -> Iterator[Bill]:
+        """Yield bills for a tenant, newest first, without building a list."""
+        for row in self.db_manager.iter_query(_Q_TENANT_BILLS, (tenant_id,)):
+            yield Bill.from_row(row)
+    
+    def mark_as_paid(self, bill_id: int, payment_date: datetime = None) -> bool:
         """Mark a bill as paid."""
         if payment_date is None:
             payment_date = datetime.now()
         
-        query = """
-            UPDATE bills 
-            SET bill_status = 'paid', paid_date = ? 
-            WHERE id = ?
-        """
         try:
-            rows_affected = db_manager.execute_query(query, (payment_date, bill_id))
+            rows_affected = self.db_manager.execute_cached(_Q_MARK_BILL_PAID, (_sql_date(payment_date), bill_id))
             if rows_affected > 0:
                 logger.info(f"Bill {bill_id} marked as paid")
                 return 1
@@ -311,40 +610,92 @@ class BillRepository(BaseRepository):
 class SystemSettingRepository(BaseRepository):
     """Repository for system settings operations."""
     
+    # Process-wide copy of the settings table, loaded on first get_setting() and
+    # reloaded after _cache_ttl seconds so changes made by other processes show up
+    _cache: Optional[Dict[str, str]] = None
+    _cache_loaded_at = 0.0
+    _cache_ttl = 60.0
+    _cache_lock = threading.Lock()
+    # Bumped by every write, so a load that raced with one is not stored
+    _cache_generation = 0
+    
     def get_by_key(self, key: str) -> Optional[SystemSetting]:
         """Get a system setting value."""
-        query = "SELECT setting_value FROM system_settings WHERE setting_key = ?"
         try:
-            result = db_manager.execute_query(query, (key,), fetch=1)
-            return result[0]['setting_value'] if result else None
+            result = self.db_manager.execute_cached(_Q_GET_SETTING, (key,), fetch=1, readonly=True, row_factory=None)
+            return result[0][0] if result else None
         except Exception as e:
             logger.error(f"Failed to get setting {key}: {e}")
             return None
     
-    @staticmethod
-    def set_setting(key: str, value: str, description: str = None) -> bool:
+    def get_setting(self, key: str) -> Optional[str]:
+        """Get a system setting value from the in-process settings cache."""
+        if not self._shared_manager:
+            return self.get_by_key(key)
+        cache, generation = self._fresh_cache()
+        if cache is not None:
+            return cache.get(key)
+        
+        # Load without holding the lock: it waits for a pooled reader, and the
+        # threads holding readers may be waiting for this lock
+        loaded_at = time.monotonic()
+        settings = self.get_all_settings()
+        # Values read inside a transaction may still be rolled back, and an
+        # empty result (load failed or empty table) is retried on the next call
+        if settings and not self.db_manager.in_transaction():
+            self._store_cache(settings, loaded_at, generation)
+        return settings.get(key)
+    
+    @classmethod
+    def _fresh_cache(cls):
+        """(cache, None) if the cache is loaded and unexpired, else (None, current generation)."""
+        with cls._cache_lock:
+            if cls._cache is not None and time.monotonic() - cls._cache_loaded_at <= cls._cache_ttl:
+                return cls._cache, None
+            return None, cls._cache_generation
+    
+    @classmethod
+    def _store_cache(cls, settings: Dict[str, str], loaded_at: float, generation: int):
+        with cls._cache_lock:
+            if cls._cache_generation == generation:
+                cls._cache, cls._cache_loaded_at = settings, loaded_at
+    
+    def set_setting(self, key: str, value: str, description: str = None) -> bool:
         """Set a system setting value."""
-        query = """
-            INSERT INTO system_settings (setting_key, setting_value, description)
-            VALUES (?, ?, ?)
-            ON CONFLICT (setting_key) 
-            DO UPDATE SET setting_value = ?, description = COALESCE(?, system_settings.description)
-        """
         try:
-            db_manager.execute_query(query, (key, value, description, value, description))
+            self.db_manager.execute_cached(_Q_SET_SETTING, (key, value, description, value, description))
+            if self._shared_manager:
+                if self.db_manager.in_transaction():
+                    # Not committed yet: reload on the next read, and again
+                    # once the value is committed
+                    self._drop_cache()
+                    self.db_manager.after_commit(self._drop_cache)
+                else:
+                    self._update_cache(key, value)
             logger.info(f"Updated setting {key} = {value}")
             return 1
         except Exception as e:
             logger.error(f"Failed to set setting {key}: {e}")
             return 0
     
-    @staticmethod
-    def get_all_settings() -> Dict[str, str]:
+    @classmethod
+    def _update_cache(cls, key: str, value: str):
+        with cls._cache_lock:
+            cls._cache_generation += 1
+            if cls._cache is not None:
+                cls._cache[key] = value
+    
+    @classmethod
+    def _drop_cache(cls):
+        with cls._cache_lock:
+            cls._cache_generation += 1
+            cls._cache = None
+    
+    def get_all_settings(self) -> Dict[str, str]:
         """Get all system settings."""
-        query = "SELECT setting_key, setting_value FROM system_settings"
         try:
-            result = db_manager.execute_query(query, fetch=1)
-            return {row['setting_key']: row['setting_value'] for row in result}
+            result = self.db_manager.execute_cached(_Q_ALL_SETTINGS, fetch=1, readonly=True, row_factory=None)
+            return dict(result)
         except Exception as e:
             logger.error(f"Failed to get all settings: {e}")
             return {}
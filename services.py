@@ -2,10 +2,17 @@
 Business logic layer for the Water Bill Tracking System
 """
 
+import asyncio
+import functools
+import json
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Tuple
 import logging
+import re
+import threading
 
+from database import dict_row
 from models import (
     Tenant, WaterReading, Bill, SystemSetting,
     TenantRepository, WaterReadingRepository, BillRepository, SystemSettingRepository
@@ -13,6 +20,203 @@ from models import (
 
 logger = logging.getLogger(__name__)
 
+# YYYY-MM-DD with plausible month/day ranges; reading dates are stored as this text
+_DATE_RE = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+
+# Reading and bill totals of one active tenant
+_Q_TENANT_SUMMARY = """
+    SELECT t.tenant_id, t.name, t.apartment_number,
+           (SELECT COUNT(*) FROM water_readings WHERE tenant_id = t.tenant_id) AS total_readings,
+           COUNT(b.id) AS total_bills,
+           (SELECT MAX(reading_date) FROM water_readings WHERE tenant_id = t.tenant_id)
+               AS last_reading_date,
+           COALESCE(SUM(CASE WHEN b.bill_status = 'paid' THEN b.total_amount END), 0.0) AS total_paid,
+           COALESCE(SUM(CASE WHEN b.bill_status <> 'paid' THEN b.total_amount END), 0.0)
+               AS outstanding_amount,
+           COUNT(CASE WHEN b.bill_status = 'paid' THEN 1 END) AS bills_paid,
+           COUNT(CASE WHEN b.bill_status <> 'paid' THEN 1 END) AS bills_outstanding
+    FROM tenants t
+    LEFT JOIN bills b ON b.tenant_id = t.tenant_id
+    WHERE t.tenant_id = ? AND t.is_active = 1
+    GROUP BY t.tenant_id
+"""
+
+def _reading_date_text(reading_date) -> str:
+    """Reading date as stored YYYY-MM-DD text; strings must name a real date."""
+    if isinstance(reading_date, str):
+        try:
+            # The regex rejects other shapes cheaply; fromisoformat then
+            # rejects impossible days such as 2020-02-30
+            if not _DATE_RE.match(reading_date):
+                raise ValueError
+            date.fromisoformat(reading_date)
+        except ValueError:
+            raise ValueError(f"Invalid reading date {reading_date!r}, expected YYYY-MM-DD") from None
+        return reading_date
+    return reading_date.strftime('%Y-%m-%d')
+
+_Q_ADD_TENANTS = """
+    INSERT OR IGNORE INTO tenants (tenant_id, name, apartment_number, phone, email, currency)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_Q_ADD_READINGS = """
+    INSERT INTO water_readings (tenant_id, reading_units, reading_date, notes)
+    VALUES (?, ?, ?, ?)
+"""
+_Q_READING_OWNERS = "SELECT id, tenant_id FROM water_readings WHERE id IN (?, ?)"
+_Q_TENANT_COUNTS = """
+    SELECT (SELECT COUNT(*) FROM water_readings WHERE tenant_id = ?),
+           (SELECT COUNT(*) FROM bills WHERE tenant_id = ?)
+"""
+
+# Display rows for the GUI lists, newest first; the _PAGE variants add LIMIT/OFFSET
+_Q_RECENT_READINGS = """
+    SELECT r.id, r.reading_date, t.name, t.apartment_number,
+           printf('%.1f', r.reading_units), COALESCE(r.notes, '')
+    FROM water_readings r
+    JOIN tenants t USING (tenant_id)
+    WHERE t.is_active = 1
+    ORDER BY r.reading_date DESC, r.id DESC
+"""
+_Q_RECENT_READINGS_PAGE = _Q_RECENT_READINGS + " LIMIT ? OFFSET ?"
+_Q_RECENT_BILLS = """
+    SELECT b.id, t.name, b.bill_period_start || ' to ' || b.bill_period_end,
+           printf('%.1f', b.units_consumed), printf('$%.2f', b.total_amount),
+           upper(b.bill_status)
+    FROM bills b
+    JOIN tenants t USING (tenant_id)
+    WHERE t.is_active = 1
+    ORDER BY b.generated_date DESC, b.id DESC
+"""
+_Q_RECENT_BILLS_PAGE = _Q_RECENT_BILLS + " LIMIT ? OFFSET ?"
+
+# Readings and bills go with the tenant through their ON DELETE CASCADE keys
+_Q_DELETE_ACTIVE_TENANT = "DELETE FROM tenants WHERE tenant_id = ? AND is_active = 1"
+
+# The same totals for every active tenant at once, plus each tenant's latest reading
+_Q_ALL_TENANT_SUMMARIES = """
+    WITH latest AS (
+        SELECT tenant_id, reading_date, reading_units,
+               COUNT(*) OVER (PARTITION BY tenant_id) AS total_readings,
+               ROW_NUMBER() OVER (PARTITION BY tenant_id
+                                  ORDER BY reading_date DESC, id DESC) AS rn
+        FROM water_readings
+    ),
+    totals AS (
+        SELECT tenant_id, COUNT(*) AS total_bills,
+               SUM(CASE WHEN bill_status = 'paid' THEN total_amount END) AS total_paid,
+               SUM(CASE WHEN bill_status <> 'paid' THEN total_amount END) AS outstanding_amount,
+               COUNT(CASE WHEN bill_status = 'paid' THEN 1 END) AS bills_paid,
+               COUNT(CASE WHEN bill_status <> 'paid' THEN 1 END) AS bills_outstanding
+        FROM bills
+        GROUP BY tenant_id
+    )
+    SELECT t.tenant_id, t.name, t.apartment_number,
+           COALESCE(l.total_readings, 0) AS total_readings,
+           COALESCE(b.total_bills, 0) AS total_bills,
+           l.reading_date AS last_reading_date,
+           COALESCE(b.total_paid, 0.0) AS total_paid,
+           COALESCE(b.outstanding_amount, 0.0) AS outstanding_amount,
+           COALESCE(b.bills_paid, 0) AS bills_paid,
+           COALESCE(b.bills_outstanding, 0) AS bills_outstanding,
+           l.reading_units AS last_reading_units
+    FROM tenants t
+    LEFT JOIN latest l ON l.tenant_id = t.tenant_id AND l.rn = 1
+    LEFT JOIN totals b ON b.tenant_id = t.tenant_id
+    WHERE t.is_active = 1
+    ORDER BY t.apartment_number
+"""
+
+# Insert a reading only if its tenant exists and is active; also return the
+# units of the tenant's previous reading (by date) to spot meter regressions
+_Q_ADD_READING = """
+    INSERT INTO water_readings (tenant_id, reading_units, reading_date, notes)
+    SELECT ?, ?, ?, ?
+    WHERE EXISTS (SELECT 1 FROM tenants WHERE tenant_id = ? AND is_active = 1)
+    RETURNING id, recorded_date,
+              (SELECT p.reading_units FROM water_readings p
+               WHERE p.tenant_id = ?
+                 AND p.reading_date <= water_readings.reading_date
+                 AND p.id <> water_readings.id
+               ORDER BY p.reading_date DESC, p.id DESC LIMIT 1) AS previous_units
+"""
+
+# Insert a bill between start reading s and end reading e (defined by the CTE
+# prepended below) if consumption is positive, in the tenant's currency. As in
+# _BILLS_FROM_LATEST_READINGS, an end reading that already has a bill is skipped
+_INSERT_BILL_FROM_READINGS = """
+    INSERT INTO bills (tenant_id, bill_period_start, bill_period_end,
+                       start_reading_id, end_reading_id, units_consumed,
+                       rate_per_unit, total_amount, currency, bill_status, due_date)
+    SELECT t.tenant_id, s.reading_date, e.reading_date, s.id, e.id,
+           e.reading_units - s.reading_units, ?, (e.reading_units - s.reading_units) * ?,
+           t.currency, 'generated', date('now', printf('+%d days', ?))
+    FROM s, e, tenants t
+    WHERE t.tenant_id = ? AND e.reading_units > s.reading_units
+      AND NOT EXISTS (SELECT 1 FROM bills b
+                      WHERE b.tenant_id = t.tenant_id AND b.end_reading_id = e.id)
+    RETURNING id, bill_period_start, bill_period_end, start_reading_id, end_reading_id,
+              units_consumed, total_amount, currency, generated_date, due_date
+"""
+_Q_BILLED_END_READING = """
+    SELECT EXISTS (SELECT 1 FROM bills WHERE tenant_id = ? AND end_reading_id = ?)
+"""
+_Q_BILL_FROM_READING_IDS = """
+    WITH s AS (SELECT id, reading_units, reading_date FROM water_readings
+               WHERE id = ? AND tenant_id = ?),
+         e AS (SELECT id, reading_units, reading_date FROM water_readings
+               WHERE id = ? AND tenant_id = ?)
+""" + _INSERT_BILL_FROM_READINGS
+_Q_BILL_FROM_LATEST_READINGS = """
+    WITH r AS (SELECT id, reading_units, reading_date FROM water_readings
+               WHERE tenant_id = ? ORDER BY reading_date DESC, id DESC LIMIT 2),
+         s AS (SELECT * FROM r ORDER BY reading_date, id LIMIT 1),
+         e AS (SELECT * FROM r ORDER BY reading_date DESC, id DESC LIMIT 1)
+""" + _INSERT_BILL_FROM_READINGS
+
+# Month-end run: bill every active tenant (or those in a JSON array of IDs) for
+# its two latest readings in one statement. Pairs that already have a bill (same
+# end reading) are skipped, so a repeated run adds nothing. RETURNING lists the
+# Bill fields in order.
+_BILLS_FROM_LATEST_READINGS = """
+    WITH ranked AS (
+        SELECT r.tenant_id, r.id, r.reading_units, r.reading_date, t.currency,
+               ROW_NUMBER() OVER (PARTITION BY r.tenant_id
+                                  ORDER BY r.reading_date DESC, r.id DESC) AS rn
+        FROM water_readings r
+        JOIN tenants t ON t.tenant_id = r.tenant_id AND t.is_active = 1{tenant_filter}
+    )
+    INSERT INTO bills (tenant_id, bill_period_start, bill_period_end,
+                       start_reading_id, end_reading_id, units_consumed,
+                       rate_per_unit, total_amount, currency, bill_status, due_date)
+    SELECT e.tenant_id, s.reading_date, e.reading_date, s.id, e.id,
+           e.reading_units - s.reading_units, ?, (e.reading_units - s.reading_units) * ?,
+           e.currency, 'generated', date('now', printf('+%d days', ?))
+    FROM ranked e
+    JOIN ranked s ON s.tenant_id = e.tenant_id AND s.rn = 2
+    WHERE e.rn = 1 AND e.reading_units > s.reading_units
+      AND NOT EXISTS (SELECT 1 FROM bills b
+                      WHERE b.tenant_id = e.tenant_id AND b.end_reading_id = e.id)
+    RETURNING tenant_id, bill_period_start, bill_period_end, units_consumed, rate_per_unit,
+              total_amount, start_reading_id, end_reading_id, currency, bill_status,
+              generated_date, due_date, paid_date, id
+"""
+_Q_BILLS_FOR_ALL = _BILLS_FROM_LATEST_READINGS.format(tenant_filter='')
+_Q_BILLS_FOR_TENANTS = _BILLS_FROM_LATEST_READINGS.format(
+    tenant_filter="\n        WHERE r.tenant_id IN (SELECT value FROM json_each(?))"
+)
+
+@dataclass
+class VerificationSnapshot:
+    """System state gathered by WaterBillService.verification_snapshot()."""
+    tenants: List[Tenant]
+    first_tenant_readings: List[WaterReading] = field(default_factory=list)
+    bill_data: Optional[Dict] = None
+    bills: List[Bill] = field(default_factory=list)
+    summaries: List[Dict] = field(default_factory=list)
+    outstanding: List[Bill] = field(default_factory=list)
+    settings: Dict[str, str] = field(default_factory=dict)
+
 class WaterBillService:
     """Main service class for water bill operations."""
     
@@ -22,18 +226,62 @@ class WaterBillService:
         self.bill_repo = BillRepository()
         self.setting_repo = SystemSettingRepository()
         self.db_manager = self.tenant_repo.db_manager
+        
+        # get_all_tenants() memo, dropped whenever tenants are added or deleted
+        self._tenants_cache = None
+        self._tenants_version = 0
+        self._tenants_lock = threading.Lock()
+        
+        # (setting text, parsed float) of the default rate last used
+        self._default_rate = None
+    
+    @property
+    def tenants_version(self) -> int:
+        """Counter bumped every time tenants are added or deleted."""
+        return self._tenants_version
+    
+    def _invalidate_tenants(self):
+        self._drop_tenants()
+        self.tenant_repo.invalidate()
+        # A reload that ran before the write commits would see the old rows
+        if self.db_manager.in_transaction():
+            self.db_manager.after_commit(self._drop_tenants)
+    
+    def _drop_tenants(self):
+        with self._tenants_lock:
+            self._tenants_cache = None
+            self._tenants_version += 1
     
     def add_tenant(self, tenant_id: str, name: str, apartment_number: str,
-                  phone: str = None, email: str = None) -> Tenant:
-        """Add a new tenant."""
+                  phone: str = None, email: str = None, currency: str = None) -> Tenant:
+        """Add a new tenant, billed in the default currency unless one is given."""
         tenant = Tenant(
             tenant_id=tenant_id,
             name=name,
             apartment_number=apartment_number,
             phone=phone,
-            email=email
+            email=email,
+            currency=currency or self.get_setting('default_currency', 'USD')
+        )
+        created = self.tenant_repo.create(tenant)
+        self._invalidate_tenants()
+        return created
+    
+    def add_tenants_bulk(self, rows: List[Tuple]) -> int:
+        """Add several tenants in one call.
+        
+        Args:
+            rows: (tenant_id, name, apartment_number, phone, email) tuples
+            
+        Returns:
+            int: Number of tenants inserted (existing tenant IDs are skipped)
+        """
+        currency = self.get_setting('default_currency', 'USD')
+        inserted = self.db_manager.execute_many(
+            _Q_ADD_TENANTS, [(*row, currency) for row in rows]
         )
-        return self.tenant_repo.create(tenant)
+        self._invalidate_tenants()
+        return inserted
     
     def delete_tenant(self, tenant_id: str) -> bool:
         """
@@ -48,165 +296,393 @@ class WaterBillService:
         Raises:
             ValueError: If tenant not found
         """
-        # Check if tenant exists
-        tenant = self.tenant_repo.get_by_id(tenant_id)
-        if not tenant:
-            raise ValueError(f"Tenant {tenant_id} not found")
-            
         try:
-            # Start a transaction
-            with self.db_manager.get_cursor() as cursor:
-                # Delete bills first (due to foreign key constraints)
-                cursor.execute("""
-                    DELETE FROM bills 
-                    WHERE tenant_id = ?
-                """, (tenant_id,))
-                
-                # Delete water readings
-                cursor.execute("""
-                    DELETE FROM water_readings 
-                    WHERE tenant_id = ?
-                """, (tenant_id,))
-                
-                # Finally delete the tenant
-                cursor.execute("""
-                    DELETE FROM tenants 
-                    WHERE tenant_id = ?
-                """, (tenant_id,))
-                
-            return True
-            
+            # One cascading statement under BEGIN IMMEDIATE
+            with self.db_manager.transaction() as conn:
+                deleted = conn.execute(_Q_DELETE_ACTIVE_TENANT, (tenant_id,)).rowcount
         except Exception as e:
             raise Exception(f"Failed to delete tenant: {str(e)}")
+        
+        if not deleted:
+            raise ValueError(f"Tenant {tenant_id} not found")
+        
+        self._invalidate_tenants()
+        return True
+    
+    def delete_tenants_bulk(self, tenant_ids: List[str]) -> int:
+        """Delete several tenants and their readings and bills in one transaction.
+        
+        The write lock is taken once for the whole batch.
+        
+        Returns:
+            int: Number of tenants deleted (unknown or inactive IDs are skipped)
+        """
+        try:
+            with self.db_manager.transaction() as conn:
+                deleted = conn.executemany(
+                    _Q_DELETE_ACTIVE_TENANT, [(tenant_id,) for tenant_id in tenant_ids]
+                ).rowcount
+        except Exception as e:
+            raise Exception(f"Failed to delete tenants: {str(e)}")
+        
+        self._invalidate_tenants()
+        return deleted
     
     def get_tenant(self, tenant_id: str) -> Optional[Tenant]:
         """Get tenant by ID."""
         return self.tenant_repo.get_by_id(tenant_id)
     
-    def get_all_tenants(self) -> List[Tenant]:
-        """Get all tenants."""
-        return self.tenant_repo.get_all()
+    def get_all_tenants(self, refresh: bool = False) -> List[Tenant]:
+        """Get all tenants.
+        
+        The list is memoized until tenants are added or deleted through this
+        service; pass refresh=True to reload it from the database.
+        """
+        with self._tenants_lock:
+            if not refresh and self._tenants_cache is not None:
+                return list(self._tenants_cache)
+            version = self._tenants_version
+        
+        tenants = self.tenant_repo.get_all()
+        # Rows read inside a transaction may still be rolled back
+        if self.db_manager.in_transaction():
+            return tenants
+        # Keep the list only if no add or delete happened while it loaded
+        with self._tenants_lock:
+            if self._tenants_version == version:
+                self._tenants_cache = tenants
+        return list(tenants)
     
     def add_water_reading(self, tenant_id: str, reading_units: float,
                          reading_date: str, notes: str = None) -> WaterReading:
-        """Add a new water reading."""
-        # Validate tenant exists
-        tenant = self.tenant_repo.get_by_id(tenant_id)
-        if not tenant:
-            raise ValueError(f"Tenant {tenant_id} not found")
+        """Add a new water reading.
+        
+        The tenant check is part of the INSERT, so this is one round trip. A
+        reading below the tenant's previous one is stored but logged as a warning.
+        """
+        reading_date = _reading_date_text(reading_date)
         
-        # Convert date string to datetime if needed
-        if isinstance(reading_date, str):
-            reading_date = datetime.strptime(reading_date, '%Y-%m-%d')
+        rows = self.db_manager.execute_cached(
+            _Q_ADD_READING,
+            (tenant_id, reading_units, reading_date, notes, tenant_id, tenant_id),
+            fetch=True
+        )
+        if not rows:
+            raise ValueError(f"Tenant {tenant_id} not found")
         
-        reading = WaterReading(
+        previous_units = rows[0]['previous_units']
+        if previous_units is not None:
+            previous_units = float(previous_units)
+        if previous_units is not None and reading_units < previous_units:
+            logger.warning(
+                f"Reading {reading_units} for tenant {tenant_id} is below the previous "
+                f"reading {previous_units}"
+            )
+        logger.info(f"Created water reading for tenant: {tenant_id}")
+        return WaterReading(
             tenant_id=tenant_id,
             reading_units=reading_units,
-            reading_date=reading_date.strftime('%Y-%m-%d'),
-            recorded_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            notes=notes
+            reading_date=reading_date,
+            recorded_date=rows[0]['recorded_date'],
+            notes=notes,
+            id=rows[0]['id']
         )
-        
-        return self.reading_repo.create(reading)
     
-    def get_tenant_readings(self, tenant_id: str) -> List[WaterReading]:
-        """Get all readings for a tenant."""
-        return self.reading_repo.get_by_tenant(tenant_id)
+    def add_water_readings_bulk(self, rows: List[Tuple]) -> int:
+        """Add several water readings in one call.
+        
+        Args:
+            rows: (tenant_id, reading_units, reading_date, notes) tuples
+            
+        Returns:
+            int: Number of readings inserted
+        """
+        params = [
+            (tenant_id, reading_units, _reading_date_text(reading_date), notes)
+            for tenant_id, reading_units, reading_date, notes in rows
+        ]
+        return self.db_manager.execute_many(_Q_ADD_READINGS, params)
     
-    def generate_bill(self, tenant_id: str, start_reading_id: int, end_reading_id: int,
-                     rate_per_unit: float = None) -> Bill:
-        """Generate a new bill from two readings."""
-        # Get readings
-        start_reading = self.reading_repo.get_by_id(start_reading_id)
-        end_reading = self.reading_repo.get_by_id(end_reading_id)
+    def add_water_reading_batch(self, readings: List[WaterReading]) -> List[WaterReading]:
+        """Add many water reading objects in one transaction (all or none).
         
-        if not start_reading or not end_reading:
-            raise ValueError("Invalid reading IDs")
+        The readings are returned with their IDs and recorded dates filled in.
         
-        if start_reading.tenant_id != tenant_id or end_reading.tenant_id != tenant_id:
-            raise ValueError("Readings do not belong to the specified tenant")
+        Raises:
+            ValueError: If a reading date is malformed or the insert fails
+        """
+        for reading in readings:
+            reading.reading_date = _reading_date_text(reading.reading_date)
         
-        # Calculate consumption
-        units_consumed = end_reading.reading_units - start_reading.reading_units
-        if units_consumed <= 0:
-            raise ValueError("End reading must be greater than start reading")
+        created = self.reading_repo.bulk_create(readings)
+        if readings and not created:
+            raise ValueError("Failed to add water readings")
+        return created
+    
+    def get_recent_readings(self, limit: Optional[int] = None, offset: int = 0) -> List[Tuple]:
+        """Get readings of active tenants, newest first, formatted for display.
+        
+        Returns:
+            List of (id, date, tenant name, apartment, units, notes) tuples
+        """
+        if limit:
+            query, params = _Q_RECENT_READINGS_PAGE, (limit, offset)
+        else:
+            query, params = _Q_RECENT_READINGS, ()
+        return self.db_manager.execute_query_fast(query, params, fetch=True, readonly=True)
+    
+    def get_tenant_readings(self, tenant_id: str, order: str = 'desc') -> List[WaterReading]:
+        """Get all readings for a tenant, newest first unless ``order='asc'``."""
+        return self.reading_repo.get_by_tenant(tenant_id, order=order)
+    
+    def generate_bill(self, tenant_id: str, start_reading_id: int = None,
+                     end_reading_id: int = None, rate_per_unit: float = None,
+                     due_days: int = 30) -> Bill:
+        """Generate a new bill from two readings.
         
+        Without reading IDs the tenant's two latest readings are used. The
+        readings are looked up and the bill inserted in a single statement;
+        an end reading that already has a bill is not billed again.
+        """
         # Get rate
         if rate_per_unit is None:
             rate_per_unit = self._get_default_rate()
         
-        # Calculate total
-        total_amount = units_consumed * rate_per_unit
+        if start_reading_id is None or end_reading_id is None:
+            query = _Q_BILL_FROM_LATEST_READINGS
+            params = (tenant_id, rate_per_unit, rate_per_unit, due_days, tenant_id)
+        else:
+            query = _Q_BILL_FROM_READING_IDS
+            params = (start_reading_id, tenant_id, end_reading_id, tenant_id,
+                      rate_per_unit, rate_per_unit, due_days, tenant_id)
+        
+        rows = self.db_manager.execute_cached(query, params, fetch=True)
+        if not rows:
+            raise ValueError(self._bill_failure_reason(tenant_id, start_reading_id, end_reading_id))
         
-        # Create bill
-        bill = Bill(
+        row = rows[0]
+        logger.info(f"Created bill for tenant: {tenant_id}")
+        return Bill(
             tenant_id=tenant_id,
-            bill_period_start=start_reading.reading_date,
-            bill_period_end=end_reading.reading_date,
-            start_reading_id=start_reading_id,
-            end_reading_id=end_reading_id,
-            units_consumed=units_consumed,
+            bill_period_start=row['bill_period_start'],
+            bill_period_end=row['bill_period_end'],
+            start_reading_id=row['start_reading_id'],
+            end_reading_id=row['end_reading_id'],
+            units_consumed=row['units_consumed'],
             rate_per_unit=rate_per_unit,
-            total_amount=total_amount,
-            bill_status='generated'
+            total_amount=row['total_amount'],
+            currency=row['currency'],
+            bill_status='generated',
+            generated_date=row['generated_date'],
+            due_date=row['due_date'],
+            id=row['id']
+        )
+    
+    def generate_bills_for_all(self, due_days: int = 30, rate_per_unit: float = None) -> List[Bill]:
+        """Bill every active tenant for its two latest readings in one statement.
+        
+        Tenants with fewer than two readings, no consumption, or an existing
+        bill for their latest reading are skipped.
+        
+        Returns:
+            List[Bill]: The bills created
+        """
+        return self._generate_latest_bills(_Q_BILLS_FOR_ALL, (), due_days, rate_per_unit)
+    
+    def generate_bills(self, tenant_ids: List[str], due_days: int = 30,
+                       rate_per_unit: float = None) -> List[Bill]:
+        """Bill the given tenants for their two latest readings in one statement.
+        
+        Works like generate_bills_for_all() restricted to tenant_ids; the IDs
+        are passed as one JSON array parameter.
+        """
+        return self._generate_latest_bills(
+            _Q_BILLS_FOR_TENANTS, (json.dumps(list(tenant_ids)),), due_days, rate_per_unit
+        )
+    
+    def _generate_latest_bills(self, query: str, params: tuple, due_days: int,
+                               rate_per_unit: Optional[float]) -> List[Bill]:
+        """Run one of the latest-readings bill queries and return the created bills."""
+        if rate_per_unit is None:
+            rate_per_unit = self._get_default_rate()
+        
+        rows = self.db_manager.execute_cached(
+            query, params + (rate_per_unit, rate_per_unit, due_days),
+            fetch=True, row_factory=None
         )
+        bills = Bill.from_rows(rows)
+        logger.info(f"Created {len(bills)} bills")
+        return bills
+    
+    def _bill_failure_reason(self, tenant_id: str, start_reading_id: Optional[int],
+                             end_reading_id: Optional[int]) -> str:
+        """Work out why generate_bill() inserted nothing (only runs on failure)."""
+        if start_reading_id is None or end_reading_id is None:
+            readings = self.reading_repo.get_by_tenant(tenant_id, limit=2)
+            if len(readings) < 2:
+                return "Need at least two readings to generate a bill"
+            end_reading_id = readings[0].id
+        else:
+            rows = self.db_manager.execute_query(
+                _Q_READING_OWNERS, (start_reading_id, end_reading_id), fetch=True, readonly=True
+            )
+            if len({row['id'] for row in rows}) < len({start_reading_id, end_reading_id}):
+                return "Invalid reading IDs"
+            if any(row['tenant_id'] != tenant_id for row in rows):
+                return "Readings do not belong to the specified tenant"
+        
+        if self.db_manager.execute_scalar(_Q_BILLED_END_READING, (tenant_id, end_reading_id)):
+            return "A bill already exists for these readings"
+        return "End reading must be greater than start reading"
+    
+    def calculate_bill(self, tenant_id: str, rate_per_unit: float = None) -> Optional[Dict]:
+        """Preview the bill for a tenant's two latest readings without saving it.
+        
+        Returns:
+            Dict with the bill figures, or None if there are fewer than two
+            readings or no consumption between them
+        """
+        readings = self.reading_repo.get_by_tenant(tenant_id, limit=2, order='asc')
+        if len(readings) < 2:
+            return None
         
-        return self.bill_repo.create(bill)
+        start_reading, end_reading = readings
+        units_consumed = end_reading.reading_units - start_reading.reading_units
+        if units_consumed <= 0:
+            return None
+        
+        if rate_per_unit is None:
+            rate_per_unit = self._get_default_rate()
+        
+        return {
+            'tenant_id': tenant_id,
+            'start_reading_id': start_reading.id,
+            'end_reading_id': end_reading.id,
+            'period_start': start_reading.reading_date,
+            'period_end': end_reading.reading_date,
+            'units_consumed': units_consumed,
+            'rate_per_unit': rate_per_unit,
+            'total_amount': units_consumed * rate_per_unit
+        }
     
     def get_tenant_bills(self, tenant_id: str) -> List[Bill]:
         """Get all bills for a tenant."""
         return self.bill_repo.get_by_tenant(tenant_id)
     
+    def get_recent_bills(self, limit: Optional[int] = None, offset: int = 0) -> List[Tuple]:
+        """Get bills of active tenants, newest first, formatted for display.
+        
+        Returns:
+            List of (id, tenant name, period, units, amount, status) tuples
+        """
+        if limit:
+            query, params = _Q_RECENT_BILLS_PAGE, (limit, offset)
+        else:
+            query, params = _Q_RECENT_BILLS, ()
+        return self.db_manager.execute_query_fast(query, params, fetch=True, readonly=True)
+    
+    def get_tenant_counts(self, tenant_id: str) -> Tuple[int, int]:
+        """Get the number of readings and bills a tenant has, without loading them."""
+        rows = self.db_manager.execute_query_fast(
+            _Q_TENANT_COUNTS, (tenant_id, tenant_id), fetch=True, readonly=True
+        )
+        return rows[0]
+    
     def get_outstanding_bills(self, tenant_id: str) -> List[Bill]:
         """Get unpaid bills for a tenant."""
-        return [b for b in self.get_tenant_bills(tenant_id) if b.bill_status != 'paid']
+        return self.bill_repo.get_outstanding(tenant_id)
     
-    def mark_bill_paid(self, bill_id: int) -> Bill:
+    def mark_bill_paid(self, bill_id: int) -> bool:
         """Mark a bill as paid."""
-        bill = self.bill_repo.get_by_id(bill_id)
-        if not bill:
+        if not self.bill_repo.mark_as_paid(bill_id, datetime.now().isoformat(sep=' ', timespec='seconds')):
             raise ValueError(f"Bill {bill_id} not found")
-        
-        bill.bill_status = 'paid'
-        bill.payment_date = datetime.now().strftime('%Y-%m-%d')
-        return self.bill_repo.update(bill)
+        return True
     
     def get_tenant_summary(self, tenant_id: str) -> Dict:
-        """Get a summary of tenant activity."""
-        tenant = self.tenant_repo.get_by_id(tenant_id)
-        if not tenant:
+        """Get a summary of tenant activity, aggregated in one SQL query."""
+        rows = self.db_manager.execute_cached(
+            _Q_TENANT_SUMMARY, (tenant_id,), fetch=True, readonly=True, row_factory=dict_row
+        )
+        if not rows:
             raise ValueError(f"Tenant {tenant_id} not found")
+        return rows[0]
+    
+    def get_tenant_summary_full(self) -> List[Dict]:
+        """Get the summary of every active tenant in one query.
         
-        readings = self.get_tenant_readings(tenant_id)
-        bills = self.get_tenant_bills(tenant_id)
-        outstanding = self.get_outstanding_bills(tenant_id)
-        
-        total_paid = sum(b.total_amount for b in bills if b.bill_status == 'paid')
-        outstanding_amount = sum(b.total_amount for b in outstanding)
+        Each dict has the get_tenant_summary() keys plus last_reading_units,
+        so callers need no per-tenant reading or bill lookups.
+        """
+        return self.db_manager.execute_cached(
+            _Q_ALL_TENANT_SUMMARIES, fetch=True, readonly=True, row_factory=dict_row
+        )
+    
+    def verification_snapshot(self) -> VerificationSnapshot:
+        """Gather tenants, readings, bills, summaries and settings in one pass.
         
-        return {
-            'tenant_id': tenant.tenant_id,
-            'name': tenant.name,
-            'apartment_number': tenant.apartment_number,
-            'total_readings': len(readings),
-            'total_bills': len(bills),
-            'last_reading_date': readings[-1].reading_date if readings else None,
-            'total_paid': total_paid,
-            'outstanding_amount': outstanding_amount,
-            'bills_paid': len(bills) - len(outstanding),
-            'bills_outstanding': len(outstanding)
-        }
+        All queries run inside one read transaction, so they share a single
+        pooled connection and see a consistent view of the database.
+        """
+        with self.db_manager.transaction(readonly=True):
+            tenants = self.get_all_tenants()
+            snapshot = VerificationSnapshot(tenants=tenants, settings=self.get_all_settings())
+            if not tenants:
+                return snapshot
+            
+            tenant_id = tenants[0].tenant_id
+            snapshot.first_tenant_readings = self.get_tenant_readings(tenant_id)
+            snapshot.bill_data = self.calculate_bill(tenant_id)
+            snapshot.bills = self.get_tenant_bills(tenant_id)
+            snapshot.summaries = self.get_tenant_summary_full()
+            snapshot.outstanding = self.bill_repo.get_outstanding_for(
+                [t.tenant_id for t in tenants]
+            )
+            return snapshot
+    
+    def get_all_settings(self) -> Dict[str, str]:
+        """Get all system settings as a key/value dict."""
+        return self.setting_repo.get_all_settings()
+    
+    def get_setting(self, key: str, default: str = None) -> Optional[str]:
+        """Get one system setting value from the cached settings."""
+        value = self.setting_repo.get_setting(key)
+        return default if value is None else value
     
     def update_setting(self, key: str, value: str) -> SystemSetting:
         """Update a system setting."""
-        setting = self.setting_repo.get_by_key(key)
-        if not setting:
+        if self.get_setting(key) is None:
             raise ValueError(f"Setting {key} not found")
         
-        setting.setting_value = value
-        return self.setting_repo.update(setting)
+        if not self.setting_repo.set_setting(key, value):
+            raise ValueError(f"Failed to update setting {key}")
+        return SystemSetting(setting_key=key, setting_value=value)
     
     def _get_default_rate(self) -> float:
-        """Get the default rate per unit from settings."""
-        setting = self.setting_repo.get_by_key('water_rate_per_unit')
-        return float(setting.setting_value) if setting else 2.50  # Default to $2.50
\ No newline at end of file
+        """Get the default rate per unit from the cached settings."""
+        value = self.get_setting('default_rate_per_unit')
+        if value is None:
+            return 2.50  # Default to $2.50
+        if self._default_rate is None or self._default_rate[0] != value:
+            self._default_rate = (value, float(value))
+        return self._default_rate[1]
+
+class AsyncWaterBillService:
+    """Asyncio front end for WaterBillService.
+    
+    Every public service method is available as a coroutine that runs the
+    synchronous method on a worker thread, so concurrent reads are spread
+    over the reader pool while writes queue on the single writer connection.
+    """
+    
+    def __init__(self, service: WaterBillService = None):
+        self.service = service or WaterBillService()
+    
+    def __getattr__(self, name):
+        attr = getattr(self.service, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+        
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+        return call
@@ -7,7 +7,41 @@ Quick utility to explore the water_bill.db database
 
 import sqlite3
 import os
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# Optional: line editing and history for the interactive prompt
+try:
+    import readline  # noqa: F401
+except ImportError:
+    readline = None
+
+# Rows fetched and printed at a time by interactive_query()
+_FETCH_SIZE = 1000
+
+# Every table with its column names, in one pass over the schema
+_Q_TABLE_COLUMNS = """
+    SELECT m.name, p.name
+    FROM sqlite_master m, pragma_table_info(m.name) p
+    WHERE m.type = 'table'
+    ORDER BY m.name, p.cid
+"""
+
+_Q_VIEWS = "SELECT name FROM sqlite_master WHERE type='view' ORDER BY name"
+_Q_TABLE_PREVIEW = "SELECT * FROM {} LIMIT 10".format
+
+def _quote(name: str) -> str:
+    """Quote an identifier for use in SQL text."""
+    return '"' + name.replace('"', '""') + '"'
+
+def _cell(val) -> str:
+    """Display text for one value: NULL for None, long strings shortened."""
+    if val is None:
+        return "NULL"
+    if isinstance(val, str) and len(val) > 15:
+        return val[:12] + "..."
+    return str(val)
 
 def view_database(db_path='water_bill.db'):
     """View all data in the SQLite database."""
@@ -20,13 +54,25 @@ def view_database(db_path='water_bill.db'):
     print("🔍 SQLite Database Viewer - water_bill.db")
     print("="*70)
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    # Viewing never writes: open read-only and map the file into memory.
+    # immutable=1 is not used, as it would ignore changes still in the WAL.
+    conn = sqlite3.connect(f"{Path(db_path).absolute().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA mmap_size = 268435456")
     cursor = conn.cursor()
     
-    # Get all tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-    tables = [row[0] for row in cursor.fetchall()]
+    # Get all tables and their columns in one query
+    columns = {}
+    for table, column in cursor.execute(_Q_TABLE_COLUMNS):
+        columns.setdefault(table, []).append(column)
+    tables = list(columns)
+    
+    # Count the rows of every table in one UNION ALL query
+    counts = {}
+    if tables:
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT {i}, COUNT(*) FROM {_quote(table)}" for i, table in enumerate(tables)
+        ))
+        counts = {tables[i]: count for i, count in cursor.fetchall()}
     
     print(f"\n📊 Found {len(tables)} tables: {', '.join(tables)}")
     
@@ -36,46 +82,29 @@ def view_database(db_path='water_bill.db'):
         print(f"📋 Table: {table}")
         print("="*70)
         
-        # Get table info
-        cursor.execute(f"PRAGMA table_info({table})")
-        columns = cursor.fetchall()
-        col_names = [col[1] for col in columns]
-        
+        col_names = columns[table]
         print(f"Columns: {', '.join(col_names)}")
         
-        # Get row count
-        cursor.execute(f"SELECT COUNT(*) FROM {table}")
-        count = cursor.fetchone()[0]
+        count = counts[table]
         print(f"Rows: {count}")
         
         # Show data
         if count > 0:
-            cursor.execute(f"SELECT * FROM {table} LIMIT 10")
+            cursor.execute(_Q_TABLE_PREVIEW(_quote(table)))
             rows = cursor.fetchall()
             
             print("\nData (first 10 rows):")
             print("-"*70)
             
-            # Print header
-            print("  ".join(f"{col:<15}" for col in col_names))
-            print("-"*70)
-            
-            # Print rows
-            for row in rows:
-                values = []
-                for val in row:
-                    if val is None:
-                        values.append("NULL")
-                    elif isinstance(val, str) and len(val) > 15:
-                        values.append(val[:12] + "...")
-                    else:
-                        values.append(str(val))
-                print("  ".join(f"{val:<15}" for val in values))
+            # Format the header and rows first, then write them in one call
+            lines = ["  ".join(col.ljust(15) for col in col_names), "-"*70]
+            lines.extend("  ".join(_cell(val).ljust(15) for val in row) for row in rows)
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("(Empty table)")
     
     # Show views
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='view' ORDER BY name")
+    cursor.execute(_Q_VIEWS)
     views = [row[0] for row in cursor.fetchall()]
     
     if views:
@@ -104,7 +133,6 @@ def interactive_query():
     print("="*60 + "\n")
     
     conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
     while True:
@@ -120,17 +148,21 @@ def interactive_query():
             cursor.execute(query)
             
             if query.lower().startswith('select'):
-                rows = cursor.fetchall()
-                if rows:
-                    # Print header
-                    columns = rows[0].keys()
-                    print("\n" + " | ".join(columns))
-                    print("-" * (len(columns) * 20))
-                    
-                    # Print rows
-                    for row in rows:
-                        print(" | ".join(str(row[col]) for col in columns))
-                    print(f"\n({len(rows)} rows)\n")
+                # Stream the result in batches so large queries use bounded memory
+                columns = [col[0] for col in cursor.description]
+                total = 0
+                while True:
+                    batch = cursor.fetchmany(_FETCH_SIZE)
+                    if not batch:
+                        break
+                    if not total:
+                        print("\n" + " | ".join(columns))
+                        print("-" * (len(columns) * 20))
+                    total += len(batch)
+                    sys.stdout.write("".join(" | ".join(map(str, row)) + "\n" for row in batch))
+                
+                if total:
+                    print(f"\n({total} rows)\n")
                 else:
                     print("(No results)\n")
             else:
@@ -144,8 +176,6 @@ def interactive_query():
     print("👋 Goodbye!")
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == 'query':
         interactive_query()
     else: